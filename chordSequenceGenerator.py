@@ -6,21 +6,21 @@ This module provides the old API while using the new refactored code internally.
 Ensures existing tests and scripts continue to work.
 """
 
+import importlib
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from sys import intern
 from typing import Tuple, List, Optional
-import plistlib
-from plistlib import UID
 
 # Import from new structure
-from src.models import Song, Bar
+from src.models import Song
 from src.generator import (
-    generate_update_block as _generate_update_block,
+    generate_update_block_from_bars as _generate_update_block_from_bars,
     read_song_index,
     write_song_index,
     resolve_song_order as _resolve_song_order,
-    ChordSequenceGenerator
 )
-from src.templates import TemplateManager
 from src.encoders.archiver import (
     PurePythonArchiver as _PurePythonArchiver,
     MozaicEncoder,
@@ -31,11 +31,55 @@ from src.encoders.archiver import (
 DEFAULT_INDEX_FILENAME = ".songs.index"
 
 
+@lru_cache(maxsize=8)
+def _compiled_template(template_name: str):
+    """Load and compile a template once from the shared TemplateManager."""
+    from src.templates import get_default_manager
+
+    return get_default_manager().load_template(template_name)
+
+
+# Heavier names kept importable from this module, loaded on first access
+_LAZY_IMPORTS = {
+    'ChordSequenceGenerator': 'src.generator',
+    'TemplateManager': 'src.templates',
+}
+
+
+def __getattr__(name: str):
+    """Import ChordSequenceGenerator/TemplateManager only when requested (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+# Closing lines shared by every @InitializeSong block
+_INITIALIZE_SONG_FOOTER = "  else\n    LabelPads {Unassigned}\n  endif\n@End\n"
+
+
+def _cached_song_from_path(path: Path) -> Song:
+    """
+    Load a Song, reusing the parsed result while the file is unchanged.
+
+    Args:
+        path: Path to chord file
+
+    Returns:
+        Song instance (shared between calls - do not mutate)
+    """
+    return Song.from_file_cached(path)
+
+
 def parse_chord_file(path: Path) -> Tuple[str, Optional[int], List[List[str]]]:
     """
     Parse a song chord file into (title, tempo, bars).
 
-    Backward compatibility wrapper for Song.from_file().
+    Backward compatibility wrapper for Song.from_file(). Parsed songs are
+    memoized by (path, mtime, size), so unchanged files are only read once.
 
     Args:
         path: Path to chord file
@@ -43,16 +87,45 @@ def parse_chord_file(path: Path) -> Tuple[str, Optional[int], List[List[str]]]:
     Returns:
         Tuple of (title, tempo, bars) where bars is List[List[str]]
     """
-    song = Song.from_file(path)
-    bars = [bar.chords for bar in song.bars]
+    song = _cached_song_from_path(path)
+    # Chord tokens repeat heavily - intern them so duplicates share one object
+    bars = [[intern(chord) for chord in bar.chords] for bar in song.bars]
     return (song.title, song.tempo, bars)
 
 
+@lru_cache(maxsize=256)
+def _cached_update_block(song_nb: int, bars: Tuple[Tuple[str, ...], ...]) -> str:
+    """Generate an update block; keyed on immutable bars so repeats are reused."""
+    return _generate_update_block_from_bars(bars, song_nb)
+
+
+def _checked_bars(bars: List[List[str]]) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Validate and strip chord lists the way the Song/Bar models do.
+
+    Raises:
+        ValueError: If there are no bars, a bar is empty, or a chord is
+                    not a non-empty string
+    """
+    if not bars:
+        raise ValueError("At least one bar is required")
+
+    checked = []
+    for chords in bars:
+        if not chords:
+            raise ValueError("Each bar needs at least one chord")
+        if not all(isinstance(chord, str) and chord.strip() for chord in chords):
+            raise ValueError("All chords must be non-empty strings")
+        checked.append(tuple(chord.strip() for chord in chords))
+    return tuple(checked)
+
+
 def generate_update_function(song_nb: int, bars: List[List[str]]) -> Tuple[str, int]:
     """
     Generate @UpdateChordsSong{n} block.
 
-    Backward compatibility wrapper.
+    Backward compatibility wrapper. Blocks are memoized on (song_nb, bars),
+    so regenerating an unchanged song in the same process is a lookup.
 
     Args:
         song_nb: Song index number
@@ -61,19 +134,37 @@ def generate_update_function(song_nb: int, bars: List[List[str]]) -> Tuple[str,
     Returns:
         Tuple of (block_text, num_bars)
     """
-    # Convert to new Bar model
-    bar_models = [Bar(chords=chords) for chords in bars]
+    # Work on the raw chord lists - no temporary Song/Bar models needed
+    block_text = _cached_update_block(song_nb, _checked_bars(bars))
 
-    # Create temporary song
-    temp_song = Song(
-        title="temp",
-        bars=bar_models
-    )
+    return (block_text, len(bars))
 
-    # Generate update block (returns tuple now, but we ignore fill_positions for backward compat)
-    block_text, _ = _generate_update_block(temp_song, song_nb)
 
-    return (block_text, len(bars))
+def _if_words(count: int) -> List[str]:
+    """Return the if/elseif keywords for a cascade of count branches."""
+    return ["if"] + ["elseif"] * (count - 1)
+
+
+def _normalize_init_songs(songs) -> List[Tuple[str, int]]:
+    """
+    Normalize songs to (title, num_bars) tuples.
+
+    Supports both tuple (old) and dict (new) formats. Input is assumed to
+    be homogeneous, so the type is checked on the first element only;
+    mixed input falls back to per-item dispatch.
+    """
+    songs = list(songs)
+
+    if songs and not isinstance(songs[0], tuple):
+        try:
+            return [(song['title'], song['num_bars']) for song in songs]
+        except TypeError:
+            pass  # Mixed formats
+
+    return [
+        song if isinstance(song, tuple) else (song['title'], song['num_bars'])
+        for song in songs
+    ]
 
 
 def generate_initialize_song_block(songs) -> str:
@@ -88,28 +179,16 @@ def generate_initialize_song_block(songs) -> str:
     Returns:
         Mozaic script block
     """
-    lines = ["@InitializeSong"]
+    normalized = _normalize_init_songs(songs)
 
-    for i, song in enumerate(songs):
-        if_word = "if" if i == 0 else "elseif"
+    entries = [
+        f"  {if_word} SongNb = {i}\n"
+        f"    LabelPads {{{title}}}\n"
+        f"    NbOfBars = {num_bars}"
+        for if_word, (i, (title, num_bars)) in zip(_if_words(len(normalized)), enumerate(normalized))
+    ]
 
-        # Support both tuple (old) and dict (new) formats
-        if isinstance(song, tuple):
-            title, num_bars = song
-        else:
-            title = song['title']
-            num_bars = song['num_bars']
-
-        lines.append(f"  {if_word} SongNb = {i}")
-        lines.append(f"    LabelPads {{{title}}}")
-        lines.append(f"    NbOfBars = {num_bars}")
-
-    lines.append("  else")
-    lines.append("    LabelPads {Unassigned}")
-    lines.append("  endif")
-    lines.append("@End\n")
-
-    return "\n".join(lines)
+    return "\n".join(["@InitializeSong", *entries, _INITIALIZE_SONG_FOOTER])
 
 
 def generate_set_song_rhythm_block(songs: List[dict]) -> str:
@@ -124,28 +203,19 @@ def generate_set_song_rhythm_block(songs: List[dict]) -> str:
     Returns:
         Mozaic script block
     """
-    has_tempo = any(song.get('tempo') for song in songs)
+    tempo_songs = [(i, tempo) for i, song in enumerate(songs) if (tempo := song.get('tempo'))]
 
-    if not has_tempo:
+    if not tempo_songs:
         return "@SetSongRhythm\n@End\n"
 
-    lines = ["@SetSongRhythm"]
-    first = True
-
-    for i, song in enumerate(songs):
-        if song.get('tempo'):
-            if_word = "if" if first else "elseif"
-            lines.append(f"  {if_word} SongNb = {i}")
-            lines.append(f"    NewTempo = {song['tempo']}")
-            lines.append("    Call @StartTempoChange")
-            first = False
-
-    if not first:  # Had at least one tempo
-        lines.append("endif")
-
-    lines.append("@End\n")
+    entries = [
+        f"  {if_word} SongNb = {i}\n"
+        f"    NewTempo = {tempo}\n"
+        "    Call @StartTempoChange"
+        for if_word, (i, tempo) in zip(_if_words(len(tempo_songs)), tempo_songs)
+    ]
 
-    return "\n".join(lines)
+    return "\n".join(["@SetSongRhythm", *entries, "endif", "@End\n"])
 
 
 def generate_full_script(songs: List[dict]) -> str:
@@ -160,8 +230,27 @@ def generate_full_script(songs: List[dict]) -> str:
     Returns:
         Complete Mozaic script text
     """
-    manager = TemplateManager()
-    return manager.render('chord_sequence.mozaic.j2', {'songs': songs})
+    return "".join(_compiled_template('chord_sequence.mozaic.j2').generate(songs=songs))
+
+
+def generate_full_script_to(fileobj, songs: List[dict]) -> None:
+    """
+    Stream the complete Mozaic script to a file-like object.
+
+    Same output as generate_full_script(), but written chunk by chunk
+    without building the whole script string in memory.
+
+    Args:
+        fileobj: Text file-like object to write to
+        songs: List of song dicts with 'title', 'num_bars', 'tempo', 'update_block'
+    """
+    _compiled_template('chord_sequence.mozaic.j2').stream(songs=songs).dump(fileobj)
+
+
+@lru_cache(maxsize=2)
+def _encoder(use_foundation: bool) -> MozaicEncoder:
+    """Return a shared encoder per mode (MozaicEncoder keeps no per-call state)."""
+    return MozaicEncoder(use_foundation=use_foundation)
 
 
 def create_nskeyedarchiver_plist_pure(data_dict: dict) -> dict:
@@ -187,7 +276,7 @@ def generate_plist_pure(script_text: str, filename: str = "chordSequence") -> by
     """
     Generate Mozaic .mozaic file using pure Python.
 
-    Backward compatibility wrapper.
+    Backward compatibility wrapper. Uses the direct binary plist writer.
 
     Args:
         script_text: The Mozaic script content
@@ -196,8 +285,8 @@ def generate_plist_pure(script_text: str, filename: str = "chordSequence") -> by
     Returns:
         Binary plist bytes
     """
-    encoder = MozaicEncoder(use_foundation=False)
-    return encoder.encode(script_text, filename)
+    encoder = _encoder(use_foundation=False)
+    return encoder.encode_stream(script_text, filename)
 
 
 def generate_plist_native(script_text: str, filename: str = "chordSequence") -> bytes:
@@ -213,7 +302,7 @@ def generate_plist_native(script_text: str, filename: str = "chordSequence") ->
     Returns:
         Binary plist bytes
     """
-    encoder = MozaicEncoder(use_foundation=True)
+    encoder = _encoder(use_foundation=True)
     return encoder.encode(script_text, filename)
 
 
@@ -238,7 +327,7 @@ def generate_plist(script_text: str, filename: str = "chordSequence",
     else:
         use_foundation = not use_pure
 
-    encoder = MozaicEncoder(use_foundation=use_foundation)
+    encoder = _encoder(use_foundation=use_foundation)
     return encoder.encode(script_text, filename)
 
 
@@ -261,8 +350,10 @@ def resolve_song_order(index_path: Path, cli_files: List, reset: bool = False) -
     Returns:
         List of filenames (strings, not Paths)
     """
-    # Convert cli_files to Paths if they aren't already
-    file_paths = [Path(f) if not isinstance(f, Path) else f for f in cli_files]
+    # Convert cli_files to Paths only if needed (callers usually pass Paths)
+    file_paths = cli_files if isinstance(cli_files, list) else list(cli_files)
+    if not all(isinstance(f, Path) for f in file_paths):
+        file_paths = [Path(f) if not isinstance(f, Path) else f for f in file_paths]
 
     # Call new function
     ordered_paths = _resolve_song_order(
@@ -272,7 +363,7 @@ def resolve_song_order(index_path: Path, cli_files: List, reset: bool = False) -
     )
 
     # Return filenames only (not full paths)
-    return [p.name for p in ordered_paths]
+    return list(map(attrgetter('name'), ordered_paths))
 
 
 __all__ = [
@@ -282,6 +373,7 @@ __all__ = [
     'generate_initialize_song_block',
     'generate_set_song_rhythm_block',
     'generate_full_script',
+    'generate_full_script_to',
     'create_nskeyedarchiver_plist_pure',
     'generate_plist_pure',
     'generate_plist_native',
@@ -298,6 +390,7 @@ __all__ = [
 # Main function for backward compatibility
 if __name__ == '__main__':
     import argparse
+    import os
     import sys
 
     parser = argparse.ArgumentParser(
@@ -336,13 +429,16 @@ if __name__ == '__main__':
     print("NOTE: This is the legacy interface. Consider using './chord-sequence' instead.\n")
 
     try:
+        from concurrent.futures import ThreadPoolExecutor
+        from src.generator import ChordSequenceGenerator
         from src.models import SongCollection
 
-        songs_list = []
-
         if args.directory:
             index_file = args.directory / DEFAULT_INDEX_FILENAME
-            song_files = list(args.directory.glob("*.txt"))
+            song_files = [
+                Path(entry.path) for entry in os.scandir(args.directory)
+                if entry.name.endswith('.txt') and entry.is_file()
+            ]
 
             if not song_files:
                 print(f"Error: No .txt files found in {args.directory}", file=sys.stderr)
@@ -355,24 +451,23 @@ if __name__ == '__main__':
                 reset=args.reset_index
             )
 
-            for path in ordered_paths:
-                song = Song.from_file(path)
-                songs_list.append(song)
-
         elif args.song_files:
-            for path in args.song_files:
-                song = Song.from_file(path)
-                songs_list.append(song)
+            ordered_paths = args.song_files
         else:
             parser.print_help()
             sys.exit(1)
 
+        # Song loading is I/O bound - read files concurrently
+        # (ex.map preserves the resolved song order)
+        with ThreadPoolExecutor(max_workers=min(32, len(ordered_paths))) as ex:
+            songs_list = list(ex.map(_cached_song_from_path, ordered_paths))
+
         songs = SongCollection(songs=songs_list)
         generator = ChordSequenceGenerator(use_foundation=not args.use_pure)
         generator.generate_mozaic_file(songs, args.output)
 
         print(f"✓ Created: {args.output}")
-        print(f"  {len(songs)} song(s), {sum(s.num_bars for s in songs)} total bars")
+        print(f"  {len(songs)} song(s), {songs.total_bars} total bars")
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -13,36 +13,57 @@ Usage:
     python3 mozaic_edit.py replace input.mozaic script.txt output.mozaic
 """
 
+import os
+import re
 import sys
+import mmap
+import shutil
 import argparse
+from contextlib import contextmanager
 from pathlib import Path
 
-
-def extract_script(mozaic_path: Path, output_path: Path):
-    """Extract script from .mozaic file."""
-    with open(mozaic_path, 'rb') as f:
-        data = f.read()
-
-    # Find script boundaries
-    start_marker = b'@OnLoad'
-    start = data.find(start_marker)
-    if start == -1:
-        print("Error: Cannot find @OnLoad in file", file=sys.stderr)
+# Script region: first @OnLoad through the last @End\n (or bare @End).
+# The greedy .* makes the engine backtrack from the end of the data, so the
+# last end marker is found in the same search that locates @OnLoad.
+_SCRIPT_RE = re.compile(rb'@OnLoad.*@End\n', re.DOTALL)
+_SCRIPT_RE_NO_NEWLINE = re.compile(rb'@OnLoad.*@End', re.DOTALL)
+
+
+@contextmanager
+def _map_file(path: Path):
+    """Memory-map a file read-only (empty files yield b'')."""
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _find_script(data, source: str):
+    """
+    Return (start, end) of the script region in data, exiting on failure.
+
+    source names the input ("file" or "template") in error messages.
+    """
+    match = _SCRIPT_RE.search(data) or _SCRIPT_RE_NO_NEWLINE.search(data)
+    if match is None:
+        if data.find(b'@OnLoad') == -1:
+            print(f"Error: Cannot find @OnLoad in {source}", file=sys.stderr)
+        else:
+            print(f"Error: Cannot find @End in {source}", file=sys.stderr)
         sys.exit(1)
+    return match.span()
 
-    # Find last @End
-    end_marker = b'@End\n'
-    end = data.rfind(end_marker)
-    if end == -1:
-        end_marker = b'@End'  # Try without newline
-        end = data.rfind(end_marker)
 
-    if end == -1:
-        print("Error: Cannot find @End in file", file=sys.stderr)
-        sys.exit(1)
+def extract_script(mozaic_path: Path, output_path: Path):
+    """Extract script from .mozaic file."""
+    with _map_file(mozaic_path) as data:
+        # Find script boundaries
+        start, end = _find_script(data, "file")
 
-    # Extract script
-    script_bytes = data[start:end + len(end_marker)]
+        # Extract script
+        script_bytes = data[start:end]
     script = script_bytes.decode('utf-8')
 
     # Save
@@ -55,67 +76,67 @@ def extract_script(mozaic_path: Path, output_path: Path):
 
 def replace_script(template_path: Path, script_path: Path, output_path: Path):
     """Replace script in .mozaic file."""
-    # Read template
-    with open(template_path, 'rb') as f:
-        data = f.read()
-
     # Read new script
     with open(script_path, 'r', encoding='utf-8') as f:
         new_script = f.read()
 
-    # Find old script
-    start_marker = b'@OnLoad'
-    start = data.find(start_marker)
-    if start == -1:
-        print("Error: Cannot find @OnLoad in template", file=sys.stderr)
-        sys.exit(1)
-
-    end_marker = b'@End\n'
-    end = data.rfind(end_marker)
-    if end == -1:
-        end_marker = b'@End'
-        end = data.rfind(end_marker)
-
-    if end == -1:
-        print("Error: Cannot find @End in template", file=sys.stderr)
-        sys.exit(1)
-
-    old_script_bytes = data[start:end + len(end_marker)]
-    old_script = old_script_bytes.decode('utf-8')
-    new_script_bytes = new_script.encode('utf-8')
-
-    print(f"Old script: {len(old_script_bytes)} bytes")
-    print(f"New script: {len(new_script_bytes)} bytes")
-
-    if len(old_script_bytes) != len(new_script_bytes):
-        diff = len(new_script_bytes) - len(old_script_bytes)
-        print(f"\n⚠ WARNING: Length mismatch ({diff:+d} bytes)")
-        print("  The file WILL be corrupted!")
-        print("\nTo fix: pad your script with comments to match the exact length:")
-        print(f"  Target length: {len(old_script_bytes)} bytes")
-        print(f"  Current length: {len(new_script_bytes)} bytes")
-        if diff > 0:
-            print(f"  Remove {diff} bytes (characters)")
-        else:
-            print(f"  Add {-diff} bytes, e.g.:")
-            print(f"    // {' ' * ((-diff) - 4)}")
-
-        response = input("\nContinue anyway? (yes/no): ")
-        if response.lower() != 'yes':
-            print("Aborted")
-            sys.exit(1)
-
-    # Replace
-    new_data = data[:start] + new_script_bytes + data[end + len(end_marker):]
+    # Map template
+    with _map_file(template_path) as data:
+        # Find old script
+        start, end = _find_script(data, "template")
+
+        old_size = len(data)
+        old_script_len = end - start
+        new_script_bytes = new_script.encode('utf-8')
+
+        print(f"Old script: {old_script_len} bytes")
+        print(f"New script: {len(new_script_bytes)} bytes")
+
+        if old_script_len != len(new_script_bytes):
+            diff = len(new_script_bytes) - old_script_len
+            print(f"\n⚠ WARNING: Length mismatch ({diff:+d} bytes)")
+            print("  The file WILL be corrupted!")
+            print("\nTo fix: pad your script with comments to match the exact length:")
+            print(f"  Target length: {old_script_len} bytes")
+            print(f"  Current length: {len(new_script_bytes)} bytes")
+            if diff > 0:
+                print(f"  Remove {diff} bytes (characters)")
+            else:
+                print(f"  Add {-diff} bytes, e.g.:")
+                print(f"    // {' ' * ((-diff) - 4)}")
+
+            response = input("\nContinue anyway? (yes/no): ")
+            if response.lower() != 'yes':
+                print("Aborted")
+                sys.exit(1)
+
+        same_length = old_script_len == len(new_script_bytes)
+        if not same_length:
+            # Slice before writing: output_path may be the mapped template itself
+            head = data[:start]
+            tail = data[end:]
+
+    if same_length:
+        # Copy the template (kernel-side where supported), then patch the
+        # script bytes in place - the unchanged regions never enter Python
+        if not (output_path.exists() and os.path.samefile(template_path, output_path)):
+            shutil.copyfile(template_path, output_path)
+        with open(output_path, 'r+b') as f:
+            f.seek(start)
+            f.write(new_script_bytes)
+    else:
+        # Replace (written piecewise, without concatenating the new file)
+        with open(output_path, 'wb') as f:
+            f.write(head)
+            f.write(new_script_bytes)
+            f.write(tail)
 
-    # Save
-    with open(output_path, 'wb') as f:
-        f.write(new_data)
+    new_size = old_size - old_script_len + len(new_script_bytes)
 
     print(f"\n✓ Created {output_path}")
-    print(f"  Size: {len(data)} → {len(new_data)} bytes ({len(new_data) - len(data):+d})")
+    print(f"  Size: {old_size} → {new_size} bytes ({new_size - old_size:+d})")
 
-    if len(data) == len(new_data):
+    if old_size == new_size:
         print("  ✓ Size preserved - should work in Mozaic!")
     else:
         print("  ⚠ Size changed - file may be corrupted!")
@@ -8,28 +8,52 @@ Usage:
     python3 mozaic_encoder.py script.txt output.mozaic
     python3 mozaic_encoder.py script.txt  # Creates script.mozaic
     python3 mozaic_encoder.py --pure-python script.txt output.mozaic  # iPad-compatible
+    python3 mozaic_encoder.py batch scripts/ -o out/  # Many files, in parallel
 """
 
+import os
 import sys
 import argparse
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import plistlib
 from plistlib import UID
 
+# Use the repo's direct binary plist writer when running from a checkout;
+# a copied standalone script falls back to plistlib (same output bytes)
+try:
+    from src.encoders.bplist import dumps_binary
+except ImportError:
+    dumps_binary = None
+
 # Try to import Foundation for native encoding (macOS only)
 try:
     from Foundation import (
-        NSKeyedArchiver, NSMutableData, NSData, NSNumber, NSString,
-        NSMutableDictionary
+        NSKeyedArchiver, NSMutableData, NSData, NSMutableDictionary
     )
     FOUNDATION_AVAILABLE = True
 except ImportError:
     FOUNDATION_AVAILABLE = False
 
+# Constant field payloads shared by both encoders
+_GUI_BYTES = b'\x00' * 36 + b'\x02\x00\x00\x00'  # 40 bytes
+_VARIABLE_BYTES = b'\x00' * 16
+_AU_VALUES = (0.0, 0.0, 0.5, 0.0, 0.0, 0.5, 0.0, 0.0)
+
+# Field names and knob labels, formatted once
+_AU_VALUE_KEYS = tuple(f'AUVALUE{i}' for i in range(8))
+_KNOB_LABEL_KEYS = tuple(f'KNOBLABEL{i}' for i in range(22))
+_KNOB_VALUE_KEYS = tuple(f'KNOBVALUE{i}' for i in range(22))
+_KNOB_LABEL_VALUES = tuple(f'Knob {i}' for i in range(22))
+_VARIABLE_KEYS = tuple(f'VARIABLE{i}' for i in range(6))
+
 
 def create_nskeyedarchiver_plist_pure(data_dict):
     """Pure Python NSKeyedArchiver implementation (no Foundation dependency)."""
     objects = ['$null', None]
+    # Bound once: the adders below run for every key and value
+    objects_append = objects.append
     nsdata_objects = []
     string_map = {}
     number_map = {}
@@ -38,38 +62,46 @@ def create_nskeyedarchiver_plist_pure(data_dict):
         if s in string_map:
             return UID(string_map[s])
         idx = len(objects)
-        objects.append(s)
+        objects_append(s)
         string_map[s] = idx
         return UID(idx)
 
     def add_number(n):
-        if n in number_map:
-            return UID(number_map[n])
+        key = (type(n), n)  # keep 1, 1.0 and True apart
+        if key in number_map:
+            return UID(number_map[key])
         idx = len(objects)
-        objects.append(n)
-        number_map[n] = idx
+        objects_append(n)
+        number_map[key] = idx
         return UID(idx)
 
     def add_nsdata(data_bytes):
         nsdata_obj = {'$class': None, 'NS.data': data_bytes}
         idx = len(objects)
-        objects.append(nsdata_obj)
+        objects_append(nsdata_obj)
         nsdata_objects.append(idx)
         return UID(idx)
 
-    keys = []
-    values = []
-
-    for key, value in data_dict.items():
-        keys.append(add_string(key))
-        if isinstance(value, str):
-            values.append(add_string(value))
-        elif isinstance(value, (int, float)):
-            values.append(add_number(value))
-        elif isinstance(value, bytes):
-            values.append(add_nsdata(value))
-        else:
+    keys = [None] * len(data_dict)
+    values = [None] * len(data_dict)
+
+    # One type() lookup per value instead of an isinstance chain
+    # (bool is listed explicitly since it is an int subclass)
+    dispatch = {
+        str: add_string,
+        int: add_number,
+        float: add_number,
+        bool: add_number,
+        bytes: add_nsdata,
+    }
+    get_adder = dispatch.get
+
+    for i, (key, value) in enumerate(data_dict.items()):
+        keys[i] = add_string(key)
+        add_value = get_adder(type(value))
+        if add_value is None:
             raise ValueError(f"Unsupported value type: {type(value)}")
+        values[i] = add_value(value)
 
     if nsdata_objects:
         nsdata_class_uid = UID(len(objects))
@@ -77,7 +109,7 @@ def create_nskeyedarchiver_plist_pure(data_dict):
             '$classes': ['NSMutableData', 'NSData', 'NSObject'],
             '$classname': 'NSMutableData'
         }
-        objects.append(nsdata_class)
+        objects_append(nsdata_class)
         for idx in nsdata_objects:
             objects[idx]['$class'] = nsdata_class_uid
 
@@ -86,7 +118,7 @@ def create_nskeyedarchiver_plist_pure(data_dict):
         '$classes': ['NSMutableDictionary', 'NSDictionary', 'NSObject'],
         '$classname': 'NSMutableDictionary'
     }
-    objects.append(nsdict_class)
+    objects_append(nsdict_class)
 
     root_dict = {
         'NS.keys': keys,
@@ -103,33 +135,32 @@ def create_nskeyedarchiver_plist_pure(data_dict):
     }
 
 
-def create_mozaic_file_pure(script_text: str, filename: str = "script") -> bytes:
-    """Create .mozaic file using pure Python (iPad-compatible)."""
+def _build_base_data_dict() -> dict:
+    """Build the constant .mozaic fields (CODE/FILENAME are placeholders)."""
     data_dict = {}
 
     # Add fields in order
-    au_values = [0.0, 0.0, 0.5, 0.0, 0.0, 0.5, 0.0, 0.0]
-    for i, val in enumerate(au_values):
-        data_dict[f'AUVALUE{i}'] = val
+    for key, val in zip(_AU_VALUE_KEYS, _AU_VALUES):
+        data_dict[key] = val
 
-    data_dict['CODE'] = script_text.encode('utf-8')
-    data_dict['FILENAME'] = filename
-    data_dict['GUI'] = b'\x00' * 36 + b'\x02\x00\x00\x00'
+    # Placeholders keep CODE/FILENAME at their position in the key order
+    data_dict['CODE'] = b''
+    data_dict['FILENAME'] = ''
+    data_dict['GUI'] = _GUI_BYTES
 
-    for i in range(22):
-        data_dict[f'KNOBLABEL{i}'] = f'Knob {i}'
+    for key, label in zip(_KNOB_LABEL_KEYS, _KNOB_LABEL_VALUES):
+        data_dict[key] = label
 
     data_dict['KNOBTITLE'] = 'Mozaic Script'
 
-    for i in range(22):
-        data_dict[f'KNOBVALUE{i}'] = 0.0
+    for key in _KNOB_VALUE_KEYS:
+        data_dict[key] = 0.0
 
     data_dict['PADTITLE'] = ''
     data_dict['SCALE'] = 4095
 
-    variable_bytes = b'\x00' * 16
-    for i in range(6):
-        data_dict[f'VARIABLE{i}'] = variable_bytes
+    for key in _VARIABLE_KEYS:
+        data_dict[key] = _VARIABLE_BYTES
 
     data_dict['XVALUE'] = 0.0
     data_dict['XYTITLE'] = ''
@@ -140,55 +171,95 @@ def create_mozaic_file_pure(script_text: str, filename: str = "script") -> bytes
     data_dict['type'] = 1635085673
     data_dict['version'] = 1
 
-    plist = create_nskeyedarchiver_plist_pure(data_dict)
-    return plistlib.dumps(plist, fmt=plistlib.FMT_BINARY)
+    return data_dict
 
 
-def create_mozaic_file_native(script_text: str, filename: str = "script") -> bytes:
-    """Create .mozaic file using native NSKeyedArchiver (macOS only)."""
-    plist_data = NSMutableDictionary.dictionary()
+# Every field except CODE and FILENAME is the same for all files
+_BASE_DATA_DICT = _build_base_data_dict()
+
+
+def _build_skeleton():
+    """
+    Archive the constant fields once, with unique CODE/FILENAME placeholders.
 
-    code_data = NSMutableData.dataWithBytes_length_(
-        script_text.encode('utf-8'),
-        len(script_text.encode('utf-8'))
+    Returns (objects, filename_index, code_index, strings); strings holds the
+    other archived strings - a filename equal to one of them would be
+    deduplicated, so that file must be archived from scratch.
+    """
+    placeholder_name = '\x00FILENAME'
+    placeholder_code = b'\x00CODE'
+
+    data_dict = _BASE_DATA_DICT.copy()
+    data_dict['CODE'] = placeholder_code
+    data_dict['FILENAME'] = placeholder_name
+    objects = create_nskeyedarchiver_plist_pure(data_dict)['$objects']
+
+    filename_index = objects.index(placeholder_name)
+    code_index = next(
+        i for i, obj in enumerate(objects)
+        if isinstance(obj, dict) and obj.get('NS.data') is placeholder_code
+    )
+    strings = frozenset(
+        obj for i, obj in enumerate(objects)
+        if i and isinstance(obj, str) and i != filename_index
     )
-    plist_data['CODE'] = code_data
+    return objects, filename_index, code_index, strings
 
-    gui_bytes = b'\x00' * 36 + b'\x02\x00\x00\x00'
-    plist_data['GUI'] = NSData.dataWithBytes_length_(gui_bytes, len(gui_bytes))
 
-    plist_data['FILENAME'] = NSString.stringWithString_(filename)
-    plist_data['KNOBTITLE'] = NSString.stringWithString_('Mozaic Script')
-    plist_data['PADTITLE'] = NSString.stringWithString_('')
-    plist_data['XYTITLE'] = NSString.stringWithString_('')
+# Archived layout of the constant fields; only CODE and FILENAME are filled in
+_SKELETON, _SKELETON_FILENAME_INDEX, _SKELETON_CODE_INDEX, _SKELETON_STRINGS = _build_skeleton()
 
-    plist_data['manufacturer'] = NSNumber.numberWithInt_(1114792301)
-    plist_data['subtype'] = NSNumber.numberWithInt_(1836022371)
-    plist_data['type'] = NSNumber.numberWithInt_(1635085673)
-    plist_data['version'] = NSNumber.numberWithInt_(1)
-    plist_data['SCALE'] = NSNumber.numberWithInt_(4095)
 
-    for i in range(22):
-        plist_data[f'KNOBVALUE{i}'] = NSNumber.numberWithDouble_(0.0)
+# Output is immutable bytes, so repeat encodes (idempotent rebuilds, tests)
+# can share it; kept small because each entry holds a whole file
+@lru_cache(maxsize=32)
+def create_mozaic_file_pure(script_text: str, filename: str = "script") -> bytes:
+    """Create .mozaic file using pure Python (iPad-compatible)."""
+    return create_mozaic_file_pure_bytes(script_text.encode('utf-8'), filename)
+
 
-    for i in range(22):
-        plist_data[f'KNOBLABEL{i}'] = NSString.stringWithString_(f'Knob {i}')
+def create_mozaic_file_pure_bytes(code_bytes: bytes, filename: str = "script") -> bytes:
+    """Create .mozaic file using pure Python from UTF-8 script bytes."""
+    if filename in _SKELETON_STRINGS:
+        data_dict = _BASE_DATA_DICT.copy()
+        data_dict['CODE'] = code_bytes
+        data_dict['FILENAME'] = filename
+        plist = create_nskeyedarchiver_plist_pure(data_dict)
+    else:
+        # Same archive as above without rebuilding it field by field
+        objects = list(_SKELETON)
+        objects[_SKELETON_FILENAME_INDEX] = filename
+        objects[_SKELETON_CODE_INDEX] = {
+            '$class': _SKELETON[_SKELETON_CODE_INDEX]['$class'],
+            'NS.data': code_bytes
+        }
+        plist = {
+            '$version': 100000,
+            '$archiver': 'NSKeyedArchiver',
+            '$top': {'root': UID(1)},
+            '$objects': objects
+        }
+    if dumps_binary is not None:
+        return dumps_binary(plist)
+    return plistlib.dumps(plist, fmt=plistlib.FMT_BINARY)
 
-    au_values = [0.0, 0.0, 0.5, 0.0, 0.0, 0.5, 0.0, 0.0]
-    for i, val in enumerate(au_values):
-        plist_data[f'AUVALUE{i}'] = NSNumber.numberWithDouble_(val)
 
-    variable_bytes = b'\x00' * 16
-    for i in range(6):
-        plist_data[f'VARIABLE{i}'] = NSData.dataWithBytes_length_(
-            variable_bytes, len(variable_bytes)
-        )
+def create_mozaic_file_native(script_text: str, filename: str = "script") -> bytes:
+    """Create .mozaic file using native NSKeyedArchiver (macOS only)."""
+    # Plain Python values: PyObjC bridges str/int/float when the whole
+    # dictionary is converted, instead of one ObjC message per field
+    plist_data = _BASE_DATA_DICT.copy()
+    plist_data['FILENAME'] = filename
 
-    plist_data['XVALUE'] = NSNumber.numberWithDouble_(0.0)
-    plist_data['YVALUE'] = NSNumber.numberWithDouble_(0.0)
+    # Binary fields keep their explicit NSMutableData/NSData classes
+    code_bytes = script_text.encode('utf-8')
+    plist_data['CODE'] = NSMutableData.dataWithBytes_length_(code_bytes, len(code_bytes))
+    plist_data['data'] = NSMutableData.data()
+    plist_data['GUI'] = NSData.dataWithBytes_length_(_GUI_BYTES, len(_GUI_BYTES))
+    for key in _VARIABLE_KEYS:
+        plist_data[key] = NSData.dataWithBytes_length_(_VARIABLE_BYTES, 16)
 
-    empty_data = NSMutableData.data()
-    plist_data['data'] = empty_data
+    plist_data = NSMutableDictionary.dictionaryWithDictionary_(plist_data)
 
     archived_data, error = NSKeyedArchiver.archivedDataWithRootObject_requiringSecureCoding_error_(
         plist_data, False, None
@@ -223,13 +294,162 @@ def create_mozaic_file(script_text: str, filename: str = "script", use_pure: boo
         return create_mozaic_file_native(script_text, filename)
 
 
+def _read_script(path: Path):
+    """
+    Read a script file, returning (script_text, code_bytes).
+
+    The file is read once as bytes (the pure encoder stores them as CODE
+    directly); the decode validates UTF-8 and gives the text for stats and
+    the native encoder. CR/CRLF newlines are translated as text mode would.
+    """
+    code_bytes = path.read_bytes()
+    script_text = code_bytes.decode('utf-8')
+    if b'\r' in code_bytes:
+        script_text = script_text.replace('\r\n', '\n').replace('\r', '\n')
+        code_bytes = script_text.encode('utf-8')
+    return script_text, code_bytes
+
+
+def _write_file(path: Path, data: bytes):
+    """Write data through a raw descriptor (no copy through a buffered writer)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        remaining = memoryview(data)
+        while remaining:
+            remaining = remaining[os.write(fd, remaining):]
+    finally:
+        os.close(fd)
+
+
+def _encode_one(job):
+    """
+    Batch worker: read, encode and write one script.
+
+    Returns (output_path, size, error) - error is None on success, so one
+    bad file does not abort the rest of the batch.
+    """
+    input_path, output_path, pure = job
+    try:
+        script_text, code_bytes = _read_script(input_path)
+        if not script_text.strip():
+            raise ValueError("Input file is empty")
+        if pure:
+            mozaic_bytes = create_mozaic_file_pure_bytes(code_bytes, output_path.stem)
+        else:
+            mozaic_bytes = create_mozaic_file(script_text, output_path.stem, use_pure=False)
+        _write_file(output_path, mozaic_bytes)
+    except Exception as e:
+        return output_path, 0, f"{input_path}: {e}"
+    return output_path, len(mozaic_bytes), None
+
+
+def _positive_int(value):
+    """argparse type: an integer >= 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def main_batch(argv):
+    """Encode many scripts in parallel (``mozaic_encoder.py batch ...``)."""
+    parser = argparse.ArgumentParser(
+        prog="mozaic_encoder.py batch",
+        description="Convert many Mozaic scripts to .mozaic files in parallel"
+    )
+    parser.add_argument("inputs", type=Path, nargs='+',
+                        help="Script files, or directories of .txt scripts")
+    parser.add_argument("-o", "--output-dir", type=Path,
+                        help="Directory for .mozaic files (default: next to each input)")
+    parser.add_argument("-j", "--jobs", type=_positive_int, default=None,
+                        help="Worker processes (default: number of CPUs)")
+    parser.add_argument("--pure-python", action="store_true",
+                        help="Force use of pure Python encoder (works on iPad)")
+    parser.add_argument("--native", action="store_true",
+                        help="Force use of native Foundation encoder (macOS only)")
+    args = parser.parse_args(argv)
+
+    if args.pure_python and args.native:
+        print("Error: Cannot specify both --pure-python and --native", file=sys.stderr)
+        sys.exit(1)
+
+    pure = not FOUNDATION_AVAILABLE
+    if args.pure_python:
+        pure = True
+    elif args.native:
+        pure = False
+
+    # Expand directories to their .txt scripts
+    input_paths = []
+    for path in args.inputs:
+        if path.is_dir():
+            input_paths.extend(sorted(path.glob('*.txt')))
+        elif path.exists():
+            input_paths.append(path)
+        else:
+            print(f"Error: Input file not found: {path}", file=sys.stderr)
+            sys.exit(1)
+
+    if not input_paths:
+        print("Error: No input scripts found", file=sys.stderr)
+        sys.exit(1)
+
+    jobs = [
+        (path,
+         (args.output_dir / path.name if args.output_dir else path).with_suffix('.mozaic'),
+         pure)
+        for path in input_paths
+    ]
+
+    # Workers write concurrently: every output must be distinct, and none
+    # may overwrite an input
+    inputs_by_path = {path.resolve(): path for path in input_paths}
+    outputs = {}
+    for input_path, output_path, _ in jobs:
+        key = output_path.resolve()
+        if key in inputs_by_path:
+            print(f"Error: Output {output_path} would overwrite input "
+                  f"{inputs_by_path[key]}", file=sys.stderr)
+            sys.exit(1)
+        if key in outputs:
+            print(f"Error: {outputs[key]} and {input_path} both map to {output_path}",
+                  file=sys.stderr)
+            sys.exit(1)
+        outputs[key] = input_path
+
+    if args.output_dir:
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Encodes are independent and CPU-bound; chunksize amortizes the IPC
+    failures = 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        for output_path, size, error in executor.map(_encode_one, jobs, chunksize=8):
+            if error:
+                failures += 1
+                print(f"Error: {error}", file=sys.stderr)
+            else:
+                print(f"✓ {output_path} ({size} bytes)")
+
+    print(f"Encoded {len(jobs) - failures}/{len(jobs)} files")
+    if failures:
+        sys.exit(1)
+
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        main_batch(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         description="Convert plain text Mozaic script to .mozaic file",
         epilog="Examples:\n"
                "  python3 mozaic_encoder.py script.txt output.mozaic\n"
                "  python3 mozaic_encoder.py script.txt  # Creates script.mozaic\n"
-               "  python3 mozaic_encoder.py --pure-python script.txt output.mozaic  # iPad-compatible\n",
+               "  python3 mozaic_encoder.py --pure-python script.txt output.mozaic  # iPad-compatible\n"
+               "  python3 mozaic_encoder.py batch scripts/ -o out/  # Many files, in parallel\n",
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
     parser.add_argument("input", type=Path, help="Input text file containing Mozaic script")
@@ -271,8 +491,7 @@ def main():
 
     # Read the script text
     try:
-        with open(args.input, 'r', encoding='utf-8') as f:
-            script_text = f.read()
+        script_text, code_bytes = _read_script(args.input)
     except Exception as e:
         print(f"Error reading input file: {e}", file=sys.stderr)
         sys.exit(1)
@@ -285,21 +504,24 @@ def main():
     filename = output_path.stem
 
     # Generate .mozaic file
-    encoder_type = "pure Python" if (use_pure if use_pure is not None else not FOUNDATION_AVAILABLE) else "native Foundation"
+    pure = use_pure if use_pure is not None else not FOUNDATION_AVAILABLE
+    encoder_type = "pure Python" if pure else "native Foundation"
     print(f"Creating {output_path} using {encoder_type} encoder...")
     print(f"  Script length: {len(script_text)} characters")
     print(f"  Lines: {len(script_text.splitlines())}")
 
     try:
-        mozaic_bytes = create_mozaic_file(script_text, filename, use_pure=use_pure)
+        if pure:
+            mozaic_bytes = create_mozaic_file_pure_bytes(code_bytes, filename)
+        else:
+            mozaic_bytes = create_mozaic_file(script_text, filename, use_pure=False)
     except Exception as e:
         print(f"Error creating .mozaic file: {e}", file=sys.stderr)
         sys.exit(1)
 
     # Write to file
     try:
-        with open(output_path, 'wb') as f:
-            f.write(mozaic_bytes)
+        _write_file(output_path, mozaic_bytes)
     except Exception as e:
         print(f"Error writing output file: {e}", file=sys.stderr)
         sys.exit(1)
@@ -9,12 +9,21 @@ Usage:
     python3 mozaic_pure_encoder.py script.txt output.mozaic
 """
 
+import os
 import sys
 import argparse
+from functools import lru_cache
 from pathlib import Path
 import plistlib
 from plistlib import UID
 
+# Use the repo's direct binary plist writer when running from a checkout;
+# a copied standalone script falls back to plistlib (same output bytes)
+try:
+    from src.encoders.bplist import dumps_binary
+except ImportError:
+    dumps_binary = None
+
 
 def create_nskeyedarchiver_plist(data_dict):
     """
@@ -23,6 +32,7 @@ def create_nskeyedarchiver_plist(data_dict):
     """
     # Objects array - starts with $null, then root dict at position 1
     objects = ['$null', None]  # Placeholder for root dict
+    objects_append = objects.append  # Bound once, used by every adder
 
     # Track NSData objects that need class reference updates
     nsdata_objects = []
@@ -36,17 +46,18 @@ def create_nskeyedarchiver_plist(data_dict):
         if s in string_map:
             return UID(string_map[s])
         idx = len(objects)
-        objects.append(s)
+        objects_append(s)
         string_map[s] = idx
         return UID(idx)
 
     def add_number(n):
         """Add number (int or float) with deduplication."""
-        if n in number_map:
-            return UID(number_map[n])
+        key = (type(n), n)  # keep 1, 1.0 and True apart
+        if key in number_map:
+            return UID(number_map[key])
         idx = len(objects)
-        objects.append(n)
-        number_map[n] = idx
+        objects_append(n)
+        number_map[key] = idx
         return UID(idx)
 
     def add_nsdata(data_bytes):
@@ -57,29 +68,33 @@ def create_nskeyedarchiver_plist(data_dict):
             'NS.data': data_bytes
         }
         idx = len(objects)
-        objects.append(nsdata_obj)
+        objects_append(nsdata_obj)
         nsdata_objects.append(idx)  # Track for later update
         return UID(idx)
 
     # Build NS.keys and NS.objects arrays for root dictionary
-    keys = []
-    values = []
+    keys = [None] * len(data_dict)
+    values = [None] * len(data_dict)
+
+    # Value adders by exact type (bool listed since it subclasses int)
+    dispatch = {
+        str: add_string,
+        int: add_number,
+        float: add_number,
+        bool: add_number,
+        bytes: add_nsdata,
+    }
+    get_adder = dispatch.get
 
-    for key, value in data_dict.items():
+    for i, (key, value) in enumerate(data_dict.items()):
         # Add key (always string)
-        keys.append(add_string(key))
+        keys[i] = add_string(key)
 
         # Add value based on type
-        if isinstance(value, str):
-            values.append(add_string(value))
-        elif isinstance(value, int):
-            values.append(add_number(value))
-        elif isinstance(value, float):
-            values.append(add_number(value))
-        elif isinstance(value, bytes):
-            values.append(add_nsdata(value))
-        else:
+        add_value = get_adder(type(value))
+        if add_value is None:
             raise ValueError(f"Unsupported value type: {type(value)}")
+        values[i] = add_value(value)
 
     # Add class metadata objects at the end
 
@@ -90,7 +105,7 @@ def create_nskeyedarchiver_plist(data_dict):
             '$classes': ['NSMutableData', 'NSData', 'NSObject'],
             '$classname': 'NSMutableData'
         }
-        objects.append(nsdata_class)
+        objects_append(nsdata_class)
 
         # Update all NSData objects with correct class reference
         for idx in nsdata_objects:
@@ -102,7 +117,7 @@ def create_nskeyedarchiver_plist(data_dict):
         '$classes': ['NSMutableDictionary', 'NSDictionary', 'NSObject'],
         '$classname': 'NSMutableDictionary'
     }
-    objects.append(nsdict_class)
+    objects_append(nsdict_class)
 
     # Create root dictionary object (goes at position 1)
     root_dict = {
@@ -123,10 +138,10 @@ def create_nskeyedarchiver_plist(data_dict):
     return plist
 
 
-def create_mozaic_file_pure(script_text: str, filename: str = "script") -> bytes:
+def _build_base_data_dict():
     """
-    Create a .mozaic file using pure Python (no Foundation dependency).
-    Returns bytes that can be written to a file.
+    Build the .mozaic fields that are the same for every file.
+    CODE and FILENAME are placeholders, set per call.
     """
     # Build the data dictionary (must be in consistent order)
     data_dict = {}
@@ -137,11 +152,11 @@ def create_mozaic_file_pure(script_text: str, filename: str = "script") -> bytes
     for i, val in enumerate(au_values):
         data_dict[f'AUVALUE{i}'] = val
 
-    # CODE - as bytes
-    data_dict['CODE'] = script_text.encode('utf-8')
+    # CODE - as bytes (placeholder, keeps the key position)
+    data_dict['CODE'] = b''
 
-    # FILENAME
-    data_dict['FILENAME'] = filename
+    # FILENAME (placeholder, keeps the key position)
+    data_dict['FILENAME'] = ''
 
     # GUI - 40 bytes
     data_dict['GUI'] = b'\x00' * 36 + b'\x02\x00\x00\x00'
@@ -186,10 +201,84 @@ def create_mozaic_file_pure(script_text: str, filename: str = "script") -> bytes
     data_dict['type'] = 1635085673          # 'aumi'
     data_dict['version'] = 1
 
-    # Create NSKeyedArchiver structure
-    plist = create_nskeyedarchiver_plist(data_dict)
+    return data_dict
+
+
+# Constant fields, built once at import
+_BASE_DATA_DICT = _build_base_data_dict()
+
+
+def _build_skeleton():
+    """
+    Archive the constant fields once, with unique CODE/FILENAME placeholders.
+
+    Returns (objects, filename_index, code_index, strings); strings holds the
+    other archived strings - a filename equal to one of them would be
+    deduplicated, so that file must be archived from scratch.
+    """
+    placeholder_name = '\x00FILENAME'
+    placeholder_code = b'\x00CODE'
+
+    data_dict = _BASE_DATA_DICT.copy()
+    data_dict['CODE'] = placeholder_code
+    data_dict['FILENAME'] = placeholder_name
+    objects = create_nskeyedarchiver_plist(data_dict)['$objects']
+
+    filename_index = objects.index(placeholder_name)
+    code_index = next(
+        i for i, obj in enumerate(objects)
+        if isinstance(obj, dict) and obj.get('NS.data') is placeholder_code
+    )
+    strings = frozenset(
+        obj for i, obj in enumerate(objects)
+        if i and isinstance(obj, str) and i != filename_index
+    )
+    return objects, filename_index, code_index, strings
+
+
+# Archived layout of the constant fields; only CODE and FILENAME are filled in
+_SKELETON, _SKELETON_FILENAME_INDEX, _SKELETON_CODE_INDEX, _SKELETON_STRINGS = _build_skeleton()
+
+
+# Output is immutable bytes, so repeat encodes (idempotent rebuilds, tests)
+# can share it; kept small because each entry holds a whole file
+@lru_cache(maxsize=32)
+def create_mozaic_file_pure(script_text: str, filename: str = "script") -> bytes:
+    """
+    Create a .mozaic file using pure Python (no Foundation dependency).
+    Returns bytes that can be written to a file.
+    """
+    return create_mozaic_file_pure_bytes(script_text.encode('utf-8'), filename)
+
+
+def create_mozaic_file_pure_bytes(code_bytes: bytes, filename: str = "script") -> bytes:
+    """
+    Create a .mozaic file from an already UTF-8 encoded script.
+    CODE stores the bytes verbatim, so no re-encode is needed.
+    """
+    if filename in _SKELETON_STRINGS:
+        data_dict = _BASE_DATA_DICT.copy()
+        data_dict['CODE'] = code_bytes
+        data_dict['FILENAME'] = filename
+        plist = create_nskeyedarchiver_plist(data_dict)
+    else:
+        # Same archive as above without rebuilding it field by field
+        objects = list(_SKELETON)
+        objects[_SKELETON_FILENAME_INDEX] = filename
+        objects[_SKELETON_CODE_INDEX] = {
+            '$class': _SKELETON[_SKELETON_CODE_INDEX]['$class'],
+            'NS.data': code_bytes
+        }
+        plist = {
+            '$version': 100000,
+            '$archiver': 'NSKeyedArchiver',
+            '$top': {'root': UID(1)},
+            '$objects': objects
+        }
 
     # Serialize to binary plist
+    if dumps_binary is not None:
+        return dumps_binary(plist)
     return plistlib.dumps(plist, fmt=plistlib.FMT_BINARY)
 
 
@@ -211,10 +300,15 @@ def main():
     else:
         output_path = args.input.with_suffix('.mozaic')
 
-    # Read the script text
+    # Read the script once as bytes; the decode validates UTF-8 and feeds
+    # the stats below, while CODE reuses the original bytes
     try:
-        with open(args.input, 'r', encoding='utf-8') as f:
-            script_text = f.read()
+        code_bytes = args.input.read_bytes()
+        script_text = code_bytes.decode('utf-8')
+        if b'\r' in code_bytes:
+            # Keep text-mode newline translation for CRLF/CR scripts
+            script_text = script_text.replace('\r\n', '\n').replace('\r', '\n')
+            code_bytes = script_text.encode('utf-8')
     except Exception as e:
         print(f"Error reading input file: {e}", file=sys.stderr)
         sys.exit(1)
@@ -232,17 +326,22 @@ def main():
     print(f"  Lines: {len(script_text.splitlines())}")
 
     try:
-        mozaic_bytes = create_mozaic_file_pure(script_text, filename)
+        mozaic_bytes = create_mozaic_file_pure_bytes(code_bytes, filename)
     except Exception as e:
         print(f"Error creating .mozaic file: {e}", file=sys.stderr)
         import traceback
         traceback.print_exc()
         sys.exit(1)
 
-    # Write to file
+    # Write to file (raw descriptor: no copy through a buffered writer)
     try:
-        with open(output_path, 'wb') as f:
-            f.write(mozaic_bytes)
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            remaining = memoryview(mozaic_bytes)
+            while remaining:
+                remaining = remaining[os.write(fd, remaining):]
+        finally:
+            os.close(fd)
     except Exception as e:
         print(f"Error writing output file: {e}", file=sys.stderr)
         sys.exit(1)
@@ -12,18 +12,39 @@ Usage:
 
 import sys
 import argparse
+import plistlib
 from pathlib import Path
 from bpylist2 import archiver
 from bpylist2.archive_types import NSMutableData
 
 
+# Bytes needed for a 200-character preview (UTF-8 is at most 4 bytes/char);
+# payloads longer than this always have more than 200 characters
+_PREVIEW_BYTES = 200 * 4 + 4
+
+
+def _decode_preview(data):
+    """Decode the first _PREVIEW_BYTES of UTF-8 data (a cut final char is dropped)."""
+    head = data[:_PREVIEW_BYTES]
+    try:
+        return head.decode('utf-8')
+    except UnicodeDecodeError as e:
+        # Only tolerate a multi-byte character split by the slice
+        if e.start < len(head) - 3 or e.reason != 'unexpected end of data':
+            raise
+        return head[:e.start].decode('utf-8')
+
+
 def format_value(value, truncate=True):
     """Format a value for display."""
     if isinstance(value, NSMutableData):
         data_len = len(value.NSdata)
-        # Try to decode as UTF-8 text
+        # Try to decode as UTF-8 text (only the preview when truncating)
         try:
-            text = value.NSdata.decode('utf-8')
+            if truncate and data_len > _PREVIEW_BYTES:
+                text = _decode_preview(value.NSdata)
+            else:
+                text = value.NSdata.decode('utf-8')
             if truncate and len(text) > 200:
                 return f"NSMutableData({data_len} bytes, text preview):\n{text[:200]}..."
             return f"NSMutableData({data_len} bytes):\n{text}"
@@ -41,12 +62,9 @@ def format_value(value, truncate=True):
     elif isinstance(value, int):
         # Check if it looks like a FourCC code
         if 1000000000 <= value <= 2000000000:
-            try:
-                import struct
-                fourcc = struct.pack('>I', value).decode('ascii', errors='replace')
-                return f"{value} (FourCC: '{fourcc}')"
-            except:
-                pass
+            # Always fits in 4 bytes here, so no packing error to handle
+            fourcc = value.to_bytes(4, 'big').decode('ascii', errors='replace')
+            return f"{value} (FourCC: '{fourcc}')"
         return str(value)
     elif isinstance(value, str):
         if truncate and len(value) > 100:
@@ -55,23 +73,43 @@ def format_value(value, truncate=True):
     return str(value)
 
 
+def _extract_code_fast(path):
+    """
+    Return the CODE payload of a .mozaic file, or None if it has none.
+
+    Reads the binary plist with plistlib and follows the root dictionary's
+    UIDs directly, without unarchiving the rest of the object graph.
+    """
+    plist = plistlib.loads(Path(path).read_bytes())
+    objects = plist['$objects']
+    root = objects[plist['$top']['root'].data]
+
+    for key_uid, value_uid in zip(root['NS.keys'], root['NS.objects']):
+        if objects[key_uid.data] == 'CODE':
+            code = objects[value_uid.data]
+            # NSData/NSMutableData are archived as {'$class': ..., 'NS.data': ...}
+            if isinstance(code, dict):
+                return code.get('NS.data')
+            return code
+    return None
+
+
 def read_mozaic(filepath, code_only=False, full=False):
     """Read and display mozaic file contents."""
-    with open(filepath, 'rb') as f:
-        data = archiver.unarchive(f.read())
-
     if code_only:
-        # Just show the CODE field
-        if 'CODE' in data:
-            code = data['CODE']
-            if isinstance(code, NSMutableData):
-                print(code.NSdata.decode('utf-8'))
-            else:
-                print(code)
-        else:
+        # Just show the CODE field (no full unarchive needed)
+        code = _extract_code_fast(filepath)
+        if code is None:
             print("No CODE field found!")
+        elif isinstance(code, bytes):
+            print(code.decode('utf-8'))
+        else:
+            print(code)
         return
 
+    with open(filepath, 'rb') as f:
+        data = archiver.unarchive(f.read())
+
     if full:
         # Show all fields without truncation
         print(f"{'='*70}")
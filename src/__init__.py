@@ -7,11 +7,43 @@ A pure Python toolkit for creating and managing Mozaic chord sequence scripts.
 __version__ = "2.0.0"
 __author__ = "Generated with Claude Code"
 
-# Public API exports
-from .models import Song, Bar, SongCollection, ScriptContext, MozaicMetadata, EncoderConfig
-from .generator import ChordSequenceGenerator, generate_update_block
-from .templates import TemplateManager, render_chord_sequence
-from .encoders import NSKeyedArchiver, MozaicEncoder, create_mozaic_file
+import importlib
+
+# Public API exports - resolved on first access (PEP 562) so that importing
+# one submodule does not pull in Jinja2, Click, etc. for the others
+_EXPORTS = {
+    'Song': '.models',
+    'Bar': '.models',
+    'SongCollection': '.models',
+    'ScriptContext': '.models',
+    'MozaicMetadata': '.models',
+    'EncoderConfig': '.models',
+    'ChordSequenceGenerator': '.generator',
+    'generate_update_block': '.generator',
+    'generate_update_block_from_bars': '.generator',
+    'TemplateManager': '.templates',
+    'render_chord_sequence': '.templates',
+    'NSKeyedArchiver': '.encoders',
+    'MozaicEncoder': '.encoders',
+    'create_mozaic_file': '.encoders',
+}
+
+
+def __getattr__(name: str):
+    """Import public API names lazily from their submodules."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily exported names in dir()."""
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     # Version
@@ -29,6 +61,7 @@ __all__ = [
     # Generator
     'ChordSequenceGenerator',
     'generate_update_block',
+    'generate_update_block_from_bars',
 
     # Templates
     'TemplateManager',
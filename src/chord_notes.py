@@ -6,10 +6,22 @@ into MIDI note numbers for playback.
 """
 
 import re
-from typing import List
-from pychord import Chord
-from pychord.utils import note_to_val
-from pychord.constants.qualities import DEFAULT_QUALITIES
+import warnings
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+# pychord is imported on the first chord parse (see _pychord_chord), so
+# commands that never expand a chord don't pay for loading it
+
+
+# Jazz notation aliases registered with pychord: (alias, existing quality)
+_QUALITY_ALIASES = (
+    ('-7', 'm7'),      # jazz notation for minor 7th
+    ('-6', 'm6'),      # jazz notation for minor 6th
+    ('Maj7', 'maj7'),  # alternative notation for maj7 (capital M)
+    ('-7b5', 'm7b5'),  # jazz notation for half-diminished
+    ('-', 'm'),        # '-' alone is jazz notation for minor
+)
 
 
 class QualityManager:
@@ -22,19 +34,6 @@ class QualityManager:
 
     _initialized = False
 
-    @classmethod
-    def _get_quality_components(cls, quality_name: str):
-        """Get components for a quality from DEFAULT_QUALITIES."""
-        for name, components in DEFAULT_QUALITIES:
-            if name == quality_name:
-                return components
-        return None
-
-    @classmethod
-    def _quality_exists(cls, quality_name: str) -> bool:
-        """Check if a quality already exists in DEFAULT_QUALITIES."""
-        return any(name == quality_name for name, _ in DEFAULT_QUALITIES)
-
     @classmethod
     def initialize(cls):
         """
@@ -45,40 +44,75 @@ class QualityManager:
         if cls._initialized:
             return
 
+        from pychord.constants.qualities import DEFAULT_QUALITIES
+        try:
+            from pychord import QualityManager as _PychordQualityManager
+        except ImportError:  # older pychord reads qualities from DEFAULT_QUALITIES
+            _PychordQualityManager = None
+
+        # Name -> components, built in one pass (first entry wins, as in a
+        # front-to-back scan)
+        qualities = {}
+        for name, components in DEFAULT_QUALITIES:
+            qualities.setdefault(name, components)
+
+        # Register through pychord's quality table where it has one: that
+        # leaves the shared DEFAULT_QUALITIES list alone and still works if
+        # the table was loaded before this runs
+        if _PychordQualityManager is not None:
+            register = _PychordQualityManager().set_quality
+        else:
+            def register(alias, components):
+                DEFAULT_QUALITIES.append((alias, components))
+
         # Register jazz notation variants
-        # '-7' is jazz notation for minor 7th (same as 'm7')
-        if not cls._quality_exists('-7'):
-            m7_components = cls._get_quality_components('m7')
-            if m7_components:
-                DEFAULT_QUALITIES.append(('-7', m7_components))
-
-        # '-6' is jazz notation for minor 6th (same as 'm6')
-        if not cls._quality_exists('-6'):
-            m6_components = cls._get_quality_components('m6')
-            if m6_components:
-                DEFAULT_QUALITIES.append(('-6', m6_components))
-
-        # 'Maj7' is alternative notation for maj7 (capital M)
-        if not cls._quality_exists('Maj7'):
-            maj7_components = cls._get_quality_components('maj7')
-            if maj7_components:
-                DEFAULT_QUALITIES.append(('Maj7', maj7_components))
-
-        # '-7b5' is jazz notation for half-diminished (same as 'm7b5')
-        if not cls._quality_exists('-7b5'):
-            m7b5_components = cls._get_quality_components('m7b5')
-            if m7b5_components:
-                DEFAULT_QUALITIES.append(('-7b5', m7b5_components))
-
-        # '-' alone is jazz notation for minor (same as 'm')
-        if not cls._quality_exists('-'):
-            m_components = cls._get_quality_components('m')
-            if m_components:
-                DEFAULT_QUALITIES.append(('-', m_components))
+        for alias, quality in _QUALITY_ALIASES:
+            if alias in qualities:
+                continue
+            components = qualities.get(quality)
+            if components:
+                register(alias, components)
+                qualities[alias] = components
 
         cls._initialized = True
 
 
+_Chord = None
+
+
+def _pychord_chord():
+    """Import pychord's Chord on first use, registering the custom qualities."""
+    global _Chord
+    if _Chord is None:
+        from pychord import Chord
+        QualityManager.initialize()
+        _Chord = Chord
+    return _Chord
+
+
+# Note name (letter + optional sharp/flat) followed by an octave number
+_NOTE_OCT_RE = re.compile(r'^([A-G][#b]?)(\d+)$')
+
+# 6 chord: root note + '6' + optional rest (e.g. a '/E' bass)
+_SIMPLIFY_6_RE = re.compile(r'^([A-G][#b]?)6(.*)$')
+
+# Pitch class (C=0 ... B=11) of every note name parse_note_with_octave
+# accepts, wrapping like pychord's note_to_val (Cb=11, B#=0)
+_PITCH_CLASSES = {
+    f"{letter}{accidental}": (value + shift) % 12
+    for letter, value in zip('CDEFGAB', (0, 2, 4, 5, 7, 9, 11))
+    for accidental, shift in (('', 0), ('#', 1), ('b', -1))
+}
+
+# MIDI number for every note string parse_note_with_octave accepts with a
+# single-digit octave (letter + optional #/b, octaves 0-9), built once
+_NOTE_TO_MIDI = {
+    f"{name}{octave}": (octave + 1) * 12 + value
+    for name, value in _PITCH_CLASSES.items()
+    for octave in range(10)
+}
+
+
 def parse_note_with_octave(note_string: str) -> tuple[str, int]:
     """
     Parse a note string with octave into note name and octave number.
@@ -96,7 +130,7 @@ def parse_note_with_octave(note_string: str) -> tuple[str, int]:
         ("F#", 3)
     """
     # Match note name (letter + optional sharp/flat) and octave number
-    match = re.match(r'^([A-G][#b]?)(\d+)$', note_string)
+    match = _NOTE_OCT_RE.match(note_string)
     if not match:
         raise ValueError(f"Invalid note format: {note_string}")
 
@@ -125,10 +159,15 @@ def note_to_midi(note_string: str) -> int:
         >>> note_to_midi("A3")
         57
     """
+    midi_number = _NOTE_TO_MIDI.get(note_string)
+    if midi_number is not None:
+        return midi_number
+
+    # Multi-digit octaves (and invalid input, which raises ValueError)
     note_name, octave = parse_note_with_octave(note_string)
 
     # Get note value (C=0, C#=1, D=2, ..., B=11)
-    note_val = note_to_val(note_name)
+    note_val = _PITCH_CLASSES[note_name]
 
     # Calculate MIDI note number
     # MIDI C4 (middle C) = 60
@@ -156,16 +195,26 @@ def midi_to_note_name(midi_number: int) -> str:
         >>> midi_to_note_name(63)
         'Eb4'
     """
+    if 0 <= midi_number < 128:
+        return _MIDI_TO_NAME[midi_number]
+    return _format_note_name(midi_number)
+
+
+def _format_note_name(midi_number: int) -> str:
+    """Format a MIDI number as a note name (used to build _MIDI_TO_NAME)."""
     # MIDI notes: C-1 = 0, C0 = 12, ..., C4 = 60
     # Reverse formula: octave = (midi / 12) - 1, note = midi % 12
     octave = (midi_number // 12) - 1
     note_index = midi_number % 12
 
-    # Note names
-    note_names = ['C', 'C#', 'D', 'Eb', 'E', 'F', 'F#', 'G', 'Ab', 'A', 'Bb', 'B']
-    note_name = note_names[note_index]
+    return f"{_NOTE_NAMES[note_index]}{octave}"
 
-    return f"{note_name}{octave}"
+
+# Note names for each pitch class
+_NOTE_NAMES = ('C', 'C#', 'D', 'Eb', 'E', 'F', 'F#', 'G', 'Ab', 'A', 'Bb', 'B')
+
+# Note name for every MIDI number, built once
+_MIDI_TO_NAME = tuple(_format_note_name(midi) for midi in range(128))
 
 
 def chord_to_midi_notes(chord_symbol: str, octave: int = 3) -> List[int]:
@@ -194,32 +243,79 @@ def chord_to_midi_notes(chord_symbol: str, octave: int = 3) -> List[int]:
         >>> chord_to_midi_notes("InvalidChord")
         []
     """
-    try:
-        # Initialize custom chord qualities
-        QualityManager.initialize()
+    # Fresh list per call - the cached tuple is shared
+    return list(chord_midi_tuple(chord_symbol, octave))
+
+
+def chord_midi_tuple(chord_symbol: str, octave: int = 3,
+                     simplified: bool = False) -> Tuple[int, ...]:
+    """
+    MIDI notes for a chord symbol as the shared, cached tuple.
 
+    Backs chord_to_midi_notes() and chord_to_simplified_midi_notes(); callers
+    that only read the notes can use it to skip their per-call list copy.
+    The simplified voicing is looked up under its simplified symbol, so e.g.
+    "C6" (simplified) and "C" share one cache entry.
+
+    Args:
+        chord_symbol: Chord symbol (e.g., "Cmaj7", "C6")
+        octave: Base octave for the chord (default: 3)
+        simplified: Reduce the chord to its basic triad first
+
+    Returns:
+        Tuple of MIDI note numbers sorted from lowest to highest
+        (empty if the chord symbol is invalid or unknown)
+    """
+    symbol = simplify_chord_symbol(chord_symbol) if simplified else chord_symbol
+    midi_notes, error = _parse_chord_notes(symbol, octave)
+
+    if error is not None:
+        # Unknown chord quality or parsing error: the cached result is empty,
+        # but every call still warns (graceful degradation)
+        warnings.warn(f"Could not parse chord '{symbol}': {error}", UserWarning)
+
+    return midi_notes
+
+
+@lru_cache(maxsize=2048)
+def _parse_chord_notes(chord_symbol: str, octave: int) -> Tuple[Tuple[int, ...], Optional[str]]:
+    """
+    Parse a chord symbol into sorted MIDI notes, memoized.
+
+    Songs repeat the same few chords many times, so each (chord, octave)
+    pair goes through pychord only once.
+
+    Returns:
+        Tuple of (midi_notes, error) - error is the parsing error message,
+        with midi_notes empty, if the chord could not be parsed
+    """
+    try:
         # Parse chord symbol
-        chord = Chord(chord_symbol)
+        chord = _pychord_chord()(chord_symbol)
 
         # Get note components with octave
         notes_with_octave = chord.components_with_pitch(octave)
 
         # Convert each note to MIDI number
-        midi_notes = [note_to_midi(note) for note in notes_with_octave]
-
-        # Sort notes (should already be sorted, but ensure it)
-        midi_notes.sort()
+        midi_notes = tuple(
+            _NOTE_TO_MIDI[note] if note in _NOTE_TO_MIDI else note_to_midi(note)
+            for note in notes_with_octave
+        )
 
-        return midi_notes
+        # pychord gives the notes from lowest to highest; only sort if an
+        # enharmonic spelling (e.g. B#) put one out of place
+        if any(low > high for low, high in zip(midi_notes, midi_notes[1:])):
+            midi_notes = tuple(sorted(midi_notes))
+        return midi_notes, None
 
-    except Exception as e:
-        # Handle unknown chord qualities or parsing errors
-        # Return empty list for graceful degradation
-        import warnings
-        warnings.warn(f"Could not parse chord '{chord_symbol}': {e}", UserWarning)
-        return []
+    except (ValueError, KeyError, AttributeError) as e:
+        # What pychord and note_to_midi raise for unreadable symbols - other
+        # errors are bugs and propagate. Keep only the message: a cached
+        # exception would pin its traceback
+        return (), str(e)
 
 
+@lru_cache(maxsize=1024)
 def simplify_chord_symbol(chord_symbol: str) -> str:
     """
     Simplify a chord symbol to basic triad for simplified voicing.
@@ -245,7 +341,10 @@ def simplify_chord_symbol(chord_symbol: str) -> str:
     # Handle 6 chords - strip the '6' to get major triad
     # Match: root note (letter + optional sharp/flat) + '6' + optional bass
     # Examples: C6, F#6, Bb6, C6/E
-    match = re.match(r'^([A-G][#b]?)6(.*)$', chord_symbol)
+    if '6' not in chord_symbol[1:3]:
+        # The '6' can only follow the root - skip the regex for other chords
+        return chord_symbol
+    match = _SIMPLIFY_6_RE.match(chord_symbol)
     if match:
         root = match.group(1)
         bass = match.group(2)  # Could be empty or something like '/E'
@@ -276,8 +375,4 @@ def chord_to_simplified_midi_notes(chord_symbol: str, octave: int = 3) -> List[i
         >>> chord_to_simplified_midi_notes("D6")
         [50, 54, 57]  # D3, F#3, A3 (same as "D")
     """
-    # Simplify the chord symbol first
-    simplified = simplify_chord_symbol(chord_symbol)
-
-    # Convert simplified chord to MIDI notes
-    return chord_to_midi_notes(simplified, octave)
+    return list(chord_midi_tuple(chord_symbol, octave, simplified=True))
@@ -5,9 +5,12 @@ This module provides Click-based CLI commands for generating and managing
 Mozaic chord sequence files.
 """
 
+import io
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple, Union
 
 import click
 
@@ -23,6 +26,113 @@ from .generator import (
 DEFAULT_INDEX_FILE = ".songs.index"
 
 
+def _scan_txt(directory: Path) -> List[Path]:
+    """
+    List the *.txt files in directory.
+
+    os.scandir yields entries with their type already known, so this skips
+    the pattern matching and per-entry stat calls of Path.glob. Order is
+    arbitrary; resolve_song_order sorts or applies the index.
+    """
+    with os.scandir(directory) as it:
+        return [
+            directory / entry.name for entry in it
+            if entry.name.endswith('.txt') and entry.is_file()
+        ]
+
+
+def _safe_load(path) -> Tuple[Path, Union[Song, Exception]]:
+    """Load one song file, returning (path, song) or (path, error)."""
+    try:
+        return path, Song.from_file_cached(path)
+    except Exception as e:
+        return path, e
+
+
+def _load_all(paths) -> List[Tuple[Path, Union[Song, Exception]]]:
+    """
+    Load song files concurrently (reading is I/O bound).
+
+    Results come back in the order of paths, so the resolved song order
+    is kept; a failed file yields its exception instead of a Song.
+    """
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+        return list(ex.map(_safe_load, paths))
+
+
+def _ordered_song_files(directory: Path, index_file: Path,
+                        reset: bool = False) -> List[Path]:
+    """Song files in directory, in index order (empty if there are none)."""
+    song_files = _scan_txt(directory)
+    if not song_files:
+        return []
+    return resolve_song_order(song_files, index_file=index_file, reset=reset)
+
+
+def _load_songs(song_files, directory: Optional[Path], index_file: Optional[Path],
+                reset_index: bool, verbose: bool, command: str) -> List[Song]:
+    """
+    Load the songs for a generate command, from a directory or from files.
+
+    Reports progress and per-file failures; exits if nothing could be loaded.
+    """
+    songs_list = []
+
+    # Load from directory if specified
+    if directory:
+        if verbose:
+            click.echo(f"Loading songs from directory: {directory}")
+
+        # Determine index file path
+        if index_file is None:
+            index_file = directory / DEFAULT_INDEX_FILE
+
+        # Get all song files, in order
+        ordered_paths = _ordered_song_files(directory, index_file, reset=reset_index)
+
+        if not ordered_paths:
+            click.echo(f"Error: No .txt files found in {directory}", err=True)
+            sys.exit(1)
+
+        if verbose:
+            click.echo(f"Found {len(ordered_paths)} song file(s)")
+            if index_file.exists() and not reset_index:
+                click.echo(f"Using song order from: {index_file}")
+
+        loaded = _load_all(ordered_paths)
+
+    # Load from individual files
+    elif song_files:
+        if verbose:
+            click.echo(f"Loading {len(song_files)} song file(s)")
+
+        loaded = _load_all(song_files)
+
+    else:
+        click.echo("Error: Specify either song files or --directory", err=True)
+        click.echo(f"Try 'chord-sequence {command} --help' for more information.")
+        sys.exit(1)
+
+    for path, song in loaded:
+        if isinstance(song, Exception):
+            name = path.name if directory else path
+            click.echo(f"  ✗ Failed to load {name}: {song}", err=True)
+            continue
+        songs_list.append(song)
+        if verbose:
+            tempo_str = f" (tempo={song.tempo})" if song.tempo else ""
+            click.echo(f"  ✓ {song.title}: {song.num_bars} bars{tempo_str}")
+
+    # Check if we loaded any songs
+    if not songs_list:
+        click.echo("Error: No valid songs loaded", err=True)
+        sys.exit(1)
+
+    return songs_list
+
+
 @click.group()
 @click.version_option(version=__version__, prog_name="chord-sequence")
 def cli():
@@ -102,71 +212,8 @@ def generate(song_files, output, directory, index_file, reset_index,
         chord-sequence generate -d songs/ --reset-index
     """
     try:
-        songs_list = []
-
-        # Load from directory if specified
-        if directory:
-            if verbose:
-                click.echo(f"Loading songs from directory: {directory}")
-
-            # Determine index file path
-            if index_file is None:
-                index_file = directory / DEFAULT_INDEX_FILE
-
-            # Get all song files
-            song_file_paths = list(directory.glob("*.txt"))
-
-            if not song_file_paths:
-                click.echo(f"Error: No .txt files found in {directory}", err=True)
-                sys.exit(1)
-
-            # Resolve order using index
-            ordered_paths = resolve_song_order(
-                song_file_paths,
-                index_file=index_file,
-                reset=reset_index
-            )
-
-            if verbose:
-                click.echo(f"Found {len(ordered_paths)} song file(s)")
-                if index_file.exists() and not reset_index:
-                    click.echo(f"Using song order from: {index_file}")
-
-            # Load songs
-            for path in ordered_paths:
-                try:
-                    song = Song.from_file(path)
-                    songs_list.append(song)
-                    if verbose:
-                        tempo_str = f" (tempo={song.tempo})" if song.tempo else ""
-                        click.echo(f"  ✓ {song.title}: {song.num_bars} bars{tempo_str}")
-                except Exception as e:
-                    click.echo(f"  ✗ Failed to load {path.name}: {e}", err=True)
-
-        # Load from individual files
-        elif song_files:
-            if verbose:
-                click.echo(f"Loading {len(song_files)} song file(s)")
-
-            for path in song_files:
-                try:
-                    song = Song.from_file(Path(path))
-                    songs_list.append(song)
-                    if verbose:
-                        tempo_str = f" (tempo={song.tempo})" if song.tempo else ""
-                        click.echo(f"  ✓ {song.title}: {song.num_bars} bars{tempo_str}")
-                except Exception as e:
-                    click.echo(f"  ✗ Failed to load {path}: {e}", err=True)
-
-        else:
-            click.echo("Error: Specify either song files or --directory", err=True)
-            click.echo("Try 'chord-sequence generate --help' for more information.")
-            sys.exit(1)
-
-        # Check if we loaded any songs
-        if not songs_list:
-            click.echo("Error: No valid songs loaded", err=True)
-            sys.exit(1)
+        songs_list = _load_songs(song_files, directory, index_file, reset_index,
+                                 verbose, 'generate')
 
         # Create song collection
         songs = SongCollection(songs=songs_list)
@@ -179,7 +226,7 @@ def generate(song_files, output, directory, index_file, reset_index,
         generator.generate_mozaic_file(songs, output, filename=filename)
 
         click.echo(f"✓ Created: {output}")
-        click.echo(f"  {len(songs)} song(s), {sum(s.num_bars for s in songs)} total bars")
+        click.echo(f"  {len(songs)} song(s), {songs.total_bars} total bars")
 
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -245,29 +292,25 @@ def list_songs(directory, index_file):
         if index_file is None:
             index_file = directory / DEFAULT_INDEX_FILE
 
-        # Get all song files
-        song_files = list(directory.glob("*.txt"))
+        # Get all song files, in order
+        ordered_files = _ordered_song_files(directory, index_file)
 
-        if not song_files:
+        if not ordered_files:
             click.echo(f"No .txt files found in {directory}")
             return
 
-        # Resolve order
-        ordered_files = resolve_song_order(song_files, index_file=index_file)
-
         click.echo(f"Songs in {directory}:")
         if index_file.exists():
             click.echo(f"(Order from: {index_file})\n")
         else:
             click.echo("(Alphabetical order)\n")
 
-        for i, path in enumerate(ordered_files):
-            try:
-                song = Song.from_file(path)
-                tempo_str = f", {song.tempo} BPM" if song.tempo else ""
-                click.echo(f"  {i}. {song.title} ({song.num_bars} bars{tempo_str})")
-            except Exception as e:
-                click.echo(f"  {i}. {path.name} (error: {e})")
+        for i, (path, song) in enumerate(_load_all(ordered_files)):
+            if isinstance(song, Exception):
+                click.echo(f"  {i}. {path.name} (error: {song})")
+                continue
+            tempo_str = f", {song.tempo} BPM" if song.tempo else ""
+            click.echo(f"  {i}. {song.title} ({song.num_bars} bars{tempo_str})")
 
         click.echo(f"\nTotal: {len(ordered_files)} song(s)")
 
@@ -360,69 +403,8 @@ def generate_text(song_files, output, directory, index_file, reset_index, verbos
         chord-sequence generate-text -d songs/ -o -
     """
     try:
-        songs_list = []
-
-        # Load from directory if specified
-        if directory:
-            if verbose:
-                click.echo(f"Loading songs from directory: {directory}")
-
-            # Determine index file path
-            if index_file is None:
-                index_file = directory / DEFAULT_INDEX_FILE
-
-            # Get all song files
-            song_file_paths = list(directory.glob("*.txt"))
-
-            if not song_file_paths:
-                click.echo(f"Error: No .txt files found in {directory}", err=True)
-                sys.exit(1)
-
-            # Resolve order using index
-            ordered_paths = resolve_song_order(
-                song_file_paths,
-                index_file=index_file,
-                reset=reset_index
-            )
-
-            if verbose:
-                click.echo(f"Found {len(ordered_paths)} song file(s)")
-
-            # Load songs
-            for path in ordered_paths:
-                try:
-                    song = Song.from_file(path)
-                    songs_list.append(song)
-                    if verbose:
-                        tempo_str = f" (tempo={song.tempo})" if song.tempo else ""
-                        click.echo(f"  ✓ {song.title}: {song.num_bars} bars{tempo_str}")
-                except Exception as e:
-                    click.echo(f"  ✗ Failed to load {path.name}: {e}", err=True)
-
-        # Load from individual files
-        elif song_files:
-            if verbose:
-                click.echo(f"Loading {len(song_files)} song file(s)")
-
-            for path in song_files:
-                try:
-                    song = Song.from_file(Path(path))
-                    songs_list.append(song)
-                    if verbose:
-                        tempo_str = f" (tempo={song.tempo})" if song.tempo else ""
-                        click.echo(f"  ✓ {song.title}: {song.num_bars} bars{tempo_str}")
-                except Exception as e:
-                    click.echo(f"  ✗ Failed to load {path}: {e}", err=True)
-
-        else:
-            click.echo("Error: Specify either song files or --directory", err=True)
-            click.echo("Try 'chord-sequence generate-text --help' for more information.")
-            sys.exit(1)
-
-        # Check if we loaded any songs
-        if not songs_list:
-            click.echo("Error: No valid songs loaded", err=True)
-            sys.exit(1)
+        songs_list = _load_songs(song_files, directory, index_file, reset_index,
+                                 verbose, 'generate-text')
 
         # Create song collection
         songs = SongCollection(songs=songs_list)
@@ -432,17 +414,30 @@ def generate_text(song_files, output, directory, index_file, reset_index, verbos
             click.echo(f"\nGenerating Mozaic script text...")
 
         generator = ChordSequenceGenerator()
-        script_text = generator.generate_script(songs)
 
-        # Output to file or stdout
+        # Stream the script as it renders (UTF-8, no newline translation)
         if str(output) == '-':
-            click.echo(script_text)
+            stdout = io.TextIOWrapper(
+                sys.stdout.buffer, encoding='utf-8', newline=''
+            )
+            try:
+                generator.generate_script_to(songs, stdout)
+                stdout.write('\n')
+                stdout.flush()
+            finally:
+                stdout.detach()  # leave the underlying stdout open, even on errors
         else:
-            with open(output, 'w', encoding='utf-8') as f:
-                f.write(script_text)
+            # Write in place (keeps symlinks and permissions); a failed render
+            # removes the partial file rather than leaving it behind
+            try:
+                with open(output, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+                    num_lines = generator.generate_script_to(songs, f)
+            except BaseException:
+                output.unlink(missing_ok=True)
+                raise
             click.echo(f"✓ Created: {output}")
-            click.echo(f"  {len(songs)} song(s), {sum(s.num_bars for s in songs)} total bars")
-            click.echo(f"  {len(script_text.splitlines())} lines")
+            click.echo(f"  {len(songs)} song(s), {songs.total_bars} total bars")
+            click.echo(f"  {num_lines} lines")
 
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
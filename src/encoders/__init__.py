@@ -8,7 +8,8 @@ Mozaic scripts into the .mozaic file format.
 from .archiver import (
     PurePythonArchiver,
     create_mozaic_file,
-    MozaicEncoder
+    MozaicEncoder,
+    MozaicTemplate
 )
 
 # Backward compatibility alias
@@ -18,5 +19,6 @@ __all__ = [
     'PurePythonArchiver',
     'NSKeyedArchiver',  # Backward compatibility
     'create_mozaic_file',
-    'MozaicEncoder'
+    'MozaicEncoder',
+    'MozaicTemplate'
 ]
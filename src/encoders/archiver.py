@@ -9,16 +9,19 @@ on any platform without dependencies.
 """
 
 import plistlib
+import struct
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 from plistlib import UID
 
+from .bplist import BinaryPlistTemplate, dumps_binary, dumps_binary_cext, LIBPLIST_AVAILABLE
+
 # Try to import Foundation for native encoding (macOS only)
 try:
     from Foundation import (
         NSKeyedArchiver as FoundationNSKeyedArchiver,
-        NSMutableData, NSData, NSNumber, NSString,
-        NSMutableDictionary
+        NSMutableData, NSData, NSMutableDictionary
     )
     FOUNDATION_AVAILABLE = True
 except ImportError:
@@ -41,6 +44,93 @@ NUM_KNOBS = 22
 NUM_VARIABLES = 6
 NUM_AU_VALUES = 8
 
+# Dedup key for floats: the exact IEEE 754 bytes
+_pack_double = struct.Struct('>d').pack
+
+# Field names and labels that never change between files
+AU_VALUE_KEYS = tuple(f'AUVALUE{i}' for i in range(NUM_AU_VALUES))
+KNOB_LABEL_KEYS = tuple(f'KNOBLABEL{i}' for i in range(NUM_KNOBS))
+KNOB_VALUE_KEYS = tuple(f'KNOBVALUE{i}' for i in range(NUM_KNOBS))
+KNOB_LABELS = tuple(f'Knob {i}' for i in range(NUM_KNOBS))
+VARIABLE_KEYS = tuple(f'VARIABLE{i}' for i in range(NUM_VARIABLES))
+
+# Immutable NSData fields for encode_foundation(), bridged once. Each key
+# keeps its own instance: NSKeyedArchiver archives a shared object once
+if FOUNDATION_AVAILABLE:
+    _NS_GUI = NSData.dataWithBytes_length_(DEFAULT_GUI_BYTES, len(DEFAULT_GUI_BYTES))
+    _NS_VARIABLES = tuple(
+        NSData.dataWithBytes_length_(DEFAULT_VARIABLE_BYTES, len(DEFAULT_VARIABLE_BYTES))
+        for _ in VARIABLE_KEYS
+    )
+
+
+def _build_data_dict_template() -> Dict[str, Any]:
+    """
+    Build the Mozaic data dictionary fields that are the same for every file.
+
+    CODE and FILENAME are placeholders; create_data_dict() fills them in.
+    """
+    data_dict = {}
+
+    # Audio Unit values (0-7)
+    for key, val in zip(AU_VALUE_KEYS, DEFAULT_AU_VALUES):
+        data_dict[key] = val
+
+    # CODE and FILENAME (placeholders, keep the key positions)
+    data_dict['CODE'] = b''
+    data_dict['FILENAME'] = ''
+
+    # GUI - 40 bytes
+    data_dict['GUI'] = DEFAULT_GUI_BYTES
+
+    # Knob labels (0-21)
+    for key, label in zip(KNOB_LABEL_KEYS, KNOB_LABELS):
+        data_dict[key] = label
+
+    # KNOBTITLE
+    data_dict['KNOBTITLE'] = 'Chord Sequence'
+
+    # Knob values (0-21)
+    for key in KNOB_VALUE_KEYS:
+        data_dict[key] = 0.0
+
+    # PADTITLE
+    data_dict['PADTITLE'] = ''
+
+    # SCALE
+    data_dict['SCALE'] = DEFAULT_SCALE
+
+    # Variables - 16-byte binary values (0-5)
+    for key in VARIABLE_KEYS:
+        data_dict[key] = DEFAULT_VARIABLE_BYTES
+
+    # XVALUE, YVALUE
+    data_dict['XVALUE'] = 0.0
+
+    # XYTITLE
+    data_dict['XYTITLE'] = ''
+
+    # YVALUE
+    data_dict['YVALUE'] = 0.0
+
+    # data field - empty bytes
+    data_dict['data'] = b''
+
+    # Integers (manufacturer, subtype, type, version)
+    data_dict['manufacturer'] = FOURCC_MANUFACTURER
+    data_dict['subtype'] = FOURCC_SUBTYPE
+    data_dict['type'] = FOURCC_TYPE
+    data_dict['version'] = DEFAULT_VERSION
+
+    return data_dict
+
+
+# Constant fields in archive order, built once at import
+_DATA_DICT_TEMPLATE = _build_data_dict_template()
+
+# Dedup map lookup default (object indices are never negative)
+_MISSING = -1
+
 
 class PurePythonArchiver:
     """
@@ -55,7 +145,8 @@ class PurePythonArchiver:
     """
 
     def __init__(self, deduplicate_strings: bool = True,
-                 deduplicate_numbers: bool = True):
+                 deduplicate_numbers: bool = True,
+                 deduplicate_data: bool = False):
         """
         Initialize the archiver.
 
@@ -63,9 +154,13 @@ class PurePythonArchiver:
             deduplicate_strings: Whether to deduplicate string objects
             deduplicate_numbers: Whether to deduplicate number objects
                                 (REQUIRED for iPad compatibility!)
+            deduplicate_data: Whether identical NSData payloads share one
+                              object (off by default: unarchiving then yields
+                              a single shared NSMutableData instance)
         """
         self.deduplicate_strings = deduplicate_strings
         self.deduplicate_numbers = deduplicate_numbers
+        self.deduplicate_data = deduplicate_data
 
         # Objects array - starts with $null, then root dict at position 1
         self.objects = ['$null', None]  # Placeholder for root dict
@@ -76,6 +171,7 @@ class PurePythonArchiver:
         # Maps for deduplication
         self.string_map = {} if deduplicate_strings else None
         self.number_map = {} if deduplicate_numbers else None
+        self.data_map = {} if deduplicate_data else None
 
     def add_string(self, s: str) -> UID:
         """
@@ -87,14 +183,18 @@ class PurePythonArchiver:
         Returns:
             UID referencing the string in the objects array
         """
-        if self.string_map is not None and s in self.string_map:
-            return UID(self.string_map[s])
+        string_map = self.string_map
+        if string_map is not None:
+            idx = string_map.get(s, _MISSING)
+            if idx != _MISSING:
+                return UID(idx)
 
-        idx = len(self.objects)
-        self.objects.append(s)
+        objects = self.objects
+        idx = len(objects)
+        objects.append(s)
 
-        if self.string_map is not None:
-            self.string_map[s] = idx
+        if string_map is not None:
+            string_map[s] = idx
 
         return UID(idx)
 
@@ -111,14 +211,23 @@ class PurePythonArchiver:
         Returns:
             UID referencing the number in the objects array
         """
-        if self.number_map is not None and n in self.number_map:
-            return UID(self.number_map[n])
-
-        idx = len(self.objects)
-        self.objects.append(n)
-
-        if self.number_map is not None:
-            self.number_map[n] = idx
+        # Floats are keyed by their IEEE bytes, so -0.0 stays apart from 0.0
+        # and a NaN matches itself; other numbers are keyed by type too, as
+        # 1, 1.0 and True are equal as dict keys but written with different
+        # binary plist markers
+        key = _pack_double(n) if type(n) is float else (type(n), n)
+        number_map = self.number_map
+        if number_map is not None:
+            idx = number_map.get(key, _MISSING)
+            if idx != _MISSING:
+                return UID(idx)
+
+        objects = self.objects
+        idx = len(objects)
+        objects.append(n)
+
+        if number_map is not None:
+            number_map[key] = idx
 
         return UID(idx)
 
@@ -134,6 +243,12 @@ class PurePythonArchiver:
         Returns:
             UID referencing the NSData object
         """
+        data_map = self.data_map
+        if data_map is not None:
+            idx = data_map.get(data_bytes, _MISSING)
+            if idx != _MISSING:
+                return UID(idx)
+
         # Create NSData object with placeholder class
         nsdata_obj = {
             '$class': None,  # Will be updated later
@@ -142,8 +257,41 @@ class PurePythonArchiver:
         idx = len(self.objects)
         self.objects.append(nsdata_obj)
         self.nsdata_objects.append(idx)  # Track for later update
+
+        if data_map is not None:
+            data_map[data_bytes] = idx
+
         return UID(idx)
 
+    def _add_real(self, n: float) -> UID:
+        """Add an int (or bool) value as a float, like every archived number."""
+        return self.add_number(float(n))
+
+    def _value_adders(self) -> Dict[type, Callable[[Any], UID]]:
+        """Return the adder for each exactly supported value type."""
+        return {
+            str: self.add_string,
+            float: self.add_number,
+            int: self._add_real,
+            bool: self._add_real,
+            bytes: self.add_nsdata,
+        }
+
+    def _value_adder(self, value: Any) -> Callable[[Any], UID]:
+        """
+        Return the adder for a value whose type is a subclass of a supported one.
+
+        Raises:
+            ValueError: If the value type is not supported
+        """
+        if isinstance(value, str):
+            return self.add_string
+        elif isinstance(value, (int, float)):
+            return self._add_real
+        elif isinstance(value, bytes):
+            return self.add_nsdata
+        raise ValueError(f"Unsupported value type: {type(value)}")
+
     def archive(self, data_dict: Dict[str, Any]) -> dict:
         """
         Create NSKeyedArchiver plist structure from a dictionary.
@@ -155,22 +303,22 @@ class PurePythonArchiver:
             Plist dictionary structure
         """
         # Build NS.keys and NS.objects arrays for root dictionary
-        keys = []
-        values = []
+        keys = [None] * len(data_dict)
+        values = [None] * len(data_dict)
 
-        for key, value in data_dict.items():
+        # Bound once for the loop below
+        add_string = self.add_string
+        get_adder = self._value_adders().get
+
+        for i, (key, value) in enumerate(data_dict.items()):
             # Add key (always string)
-            keys.append(self.add_string(key))
-
-            # Add value based on type
-            if isinstance(value, str):
-                values.append(self.add_string(value))
-            elif isinstance(value, (int, float)):
-                values.append(self.add_number(float(value)))
-            elif isinstance(value, bytes):
-                values.append(self.add_nsdata(value))
-            else:
-                raise ValueError(f"Unsupported value type: {type(value)}")
+            keys[i] = add_string(key)
+
+            # Add value based on its exact type
+            add_value = get_adder(type(value))
+            if add_value is None:
+                add_value = self._value_adder(value)
+            values[i] = add_value(value)
 
         # Add class metadata objects at the end
 
@@ -214,6 +362,37 @@ class PurePythonArchiver:
         return plist
 
 
+# Unique placeholders used while building the archive skeleton
+_SKELETON_FILENAME = '\x00FILENAME'
+_SKELETON_CODE = b'\x00CODE'
+
+
+@lru_cache(maxsize=1)
+def _mozaic_skeleton() -> Tuple[List[Any], int, int, FrozenSet[str]]:
+    """
+    Build the deduplicated $objects layout shared by every Mozaic archive.
+
+    Only CODE and FILENAME vary between files, so the archive is built once
+    with placeholders for them and their object indices are recorded.
+
+    Returns:
+        Tuple of (objects, filename_index, code_index, strings) where strings
+        holds every other string in the layout (a filename equal to one of
+        them would be deduplicated differently, so it cannot use the skeleton)
+    """
+    archiver = PurePythonArchiver()
+    data_dict = MozaicEncoder().create_data_dict('', _SKELETON_FILENAME)
+    data_dict['CODE'] = _SKELETON_CODE
+    objects = archiver.archive(data_dict)['$objects']
+
+    filename_index = archiver.string_map.pop(_SKELETON_FILENAME)
+    code_index = next(
+        idx for idx in archiver.nsdata_objects
+        if objects[idx]['NS.data'] is _SKELETON_CODE
+    )
+    return objects, filename_index, code_index, frozenset(archiver.string_map)
+
+
 class MozaicEncoder:
     """
     High-level encoder for creating Mozaic .mozaic files.
@@ -224,7 +403,10 @@ class MozaicEncoder:
 
     def __init__(self, use_foundation: bool = False,
                  deduplicate_strings: bool = True,
-                 deduplicate_numbers: bool = True):
+                 deduplicate_numbers: bool = True,
+                 use_cext: bool = False,
+                 use_plistlib: bool = False,
+                 deduplicate_data: bool = False):
         """
         Initialize the encoder.
 
@@ -232,10 +414,26 @@ class MozaicEncoder:
             use_foundation: Whether to use native Foundation (macOS only)
             deduplicate_strings: Whether to deduplicate strings
             deduplicate_numbers: Whether to deduplicate numbers (critical!)
+            use_cext: Whether encode_stream() should use libplist's compiled
+                      writer when installed (falls back to pure Python)
+            use_plistlib: Whether encode() should serialize pure Python
+                          archives through plistlib instead of the direct
+                          binary plist writer (same bytes, slower)
+            deduplicate_data: Whether identical NSData payloads (e.g. the six
+                              VARIABLE blobs) share one archived object
         """
         self.use_foundation = use_foundation and FOUNDATION_AVAILABLE
+        self.use_cext = use_cext and LIBPLIST_AVAILABLE
+        self.plist_backend = 'libplist' if self.use_cext else 'python'
+        self.use_plistlib = use_plistlib
         self.deduplicate_strings = deduplicate_strings
         self.deduplicate_numbers = deduplicate_numbers
+        self.deduplicate_data = deduplicate_data
+
+    def _default_layout(self) -> bool:
+        """Return True if archives use the shared skeleton/template layout."""
+        return (self.deduplicate_strings and self.deduplicate_numbers
+                and not self.deduplicate_data)
 
     def create_data_dict(self, script_text: str, filename: str = "chordSequence") -> Dict[str, Any]:
         """
@@ -250,67 +448,84 @@ class MozaicEncoder:
         Returns:
             Dictionary with all Mozaic file data
         """
-        data_dict = {}
-
-        # Audio Unit values (0-7)
-        for i, val in enumerate(DEFAULT_AU_VALUES):
-            data_dict[f'AUVALUE{i}'] = val
-
-        # CODE - script as bytes
+        # Constant fields come from the prebuilt layout; CODE and FILENAME
+        # keep their key positions and are filled in here
+        data_dict = _DATA_DICT_TEMPLATE.copy()
         data_dict['CODE'] = script_text.encode('utf-8')
-
-        # FILENAME
         data_dict['FILENAME'] = filename
 
-        # GUI - 40 bytes
-        data_dict['GUI'] = DEFAULT_GUI_BYTES
+        return data_dict
 
-        # Knob labels (0-21)
-        for i in range(NUM_KNOBS):
-            data_dict[f'KNOBLABEL{i}'] = f'Knob {i}'
+    def archive(self, script_text: str, filename: str = "chordSequence") -> dict:
+        """
+        Create the NSKeyedArchiver plist structure for a Mozaic file.
 
-        # KNOBTITLE
-        data_dict['KNOBTITLE'] = 'Chord Sequence'
+        Equivalent to archiving create_data_dict() with PurePythonArchiver,
+        but with the default deduplication settings the fixed part of the layout comes
+        from a precomputed skeleton, and only CODE and FILENAME are filled in.
 
-        # Knob values (0-21)
-        for i in range(NUM_KNOBS):
-            data_dict[f'KNOBVALUE{i}'] = 0.0
+        Args:
+            script_text: The Mozaic script content
+            filename: Filename to embed
 
-        # PADTITLE
-        data_dict['PADTITLE'] = ''
+        Returns:
+            Plist dictionary structure (objects other than CODE and FILENAME
+            may be shared between calls - do not mutate)
+        """
+        skeleton, filename_index, code_index, strings = _mozaic_skeleton()
 
-        # SCALE
-        data_dict['SCALE'] = DEFAULT_SCALE
+        if not self._default_layout() or filename in strings:
+            archiver = PurePythonArchiver(
+                deduplicate_strings=self.deduplicate_strings,
+                deduplicate_numbers=self.deduplicate_numbers,
+                deduplicate_data=self.deduplicate_data
+            )
+            return archiver.archive(self.create_data_dict(script_text, filename))
 
-        # Variables - 16-byte binary values (0-5)
-        for i in range(NUM_VARIABLES):
-            data_dict[f'VARIABLE{i}'] = DEFAULT_VARIABLE_BYTES
+        objects = list(skeleton)
+        objects[filename_index] = filename
+        objects[code_index] = {
+            '$class': skeleton[code_index]['$class'],
+            'NS.data': script_text.encode('utf-8')
+        }
 
-        # XVALUE, YVALUE
-        data_dict['XVALUE'] = 0.0
+        return {
+            '$version': 100000,
+            '$archiver': 'NSKeyedArchiver',
+            '$top': {'root': UID(1)},
+            '$objects': objects
+        }
 
-        # XYTITLE
-        data_dict['XYTITLE'] = ''
+    def encode_pure_python(self, script_text: str, filename: str = "chordSequence") -> bytes:
+        """
+        Encode using pure Python NSKeyedArchiver implementation.
 
-        # YVALUE
-        data_dict['YVALUE'] = 0.0
+        Works on any platform including iOS/iPad.
 
-        # data field - empty bytes
-        data_dict['data'] = b''
+        Args:
+            script_text: The Mozaic script content
+            filename: Filename to embed
 
-        # Integers (manufacturer, subtype, type, version)
-        data_dict['manufacturer'] = FOURCC_MANUFACTURER
-        data_dict['subtype'] = FOURCC_SUBTYPE
-        data_dict['type'] = FOURCC_TYPE
-        data_dict['version'] = DEFAULT_VERSION
+        Returns:
+            Binary plist bytes
+        """
+        # Create archive structure
+        plist = self.archive(script_text, filename)
 
-        return data_dict
+        # Serialize to binary plist
+        return plistlib.dumps(plist, fmt=plistlib.FMT_BINARY)
 
-    def encode_pure_python(self, script_text: str, filename: str = "chordSequence") -> bytes:
+    def encode_stream(self, script_text: str, filename: str = "chordSequence") -> bytes:
         """
-        Encode using pure Python NSKeyedArchiver implementation.
+        Encode using pure Python, writing the binary plist directly.
 
-        Works on any platform including iOS/iPad.
+        Produces the same bytes as encode_pure_python(), but serializes the
+        archive with BinaryPlistWriter into a single buffer rather than
+        through plistlib's generic writer. With the default deduplication
+        settings, the encoded file for each filename is cached as a
+        MozaicTemplate and only CODE is spliced in. With use_cext=True and
+        libplist installed, the compiled libplist writer is used instead;
+        the backend in use is recorded in self.plist_backend.
 
         Args:
             script_text: The Mozaic script content
@@ -319,18 +534,13 @@ class MozaicEncoder:
         Returns:
             Binary plist bytes
         """
-        # Create data dictionary
-        data_dict = self.create_data_dict(script_text, filename)
+        if self.use_cext:
+            return dumps_binary_cext(self.archive(script_text, filename))
 
-        # Create archiver and encode
-        archiver = PurePythonArchiver(
-            deduplicate_strings=self.deduplicate_strings,
-            deduplicate_numbers=self.deduplicate_numbers
-        )
-        plist = archiver.archive(data_dict)
+        if self._default_layout():
+            return _mozaic_template(filename).encode(script_text.encode('utf-8'))
 
-        # Serialize to binary plist
-        return plistlib.dumps(plist, fmt=plistlib.FMT_BINARY)
+        return dumps_binary(self.archive(script_text, filename))
 
     def encode_foundation(self, script_text: str, filename: str = "chordSequence") -> bytes:
         """
@@ -349,57 +559,20 @@ class MozaicEncoder:
         if not FOUNDATION_AVAILABLE:
             raise RuntimeError("Foundation framework not available (macOS only)")
 
-        # Create the data structure using Foundation types
-        plist_data = NSMutableDictionary.dictionary()
-
-        # CODE - NSMutableData containing the script
-        code_bytes = script_text.encode('utf-8')
-        code_data = NSMutableData.dataWithBytes_length_(code_bytes, len(code_bytes))
-        plist_data['CODE'] = code_data
+        # Start from the plain Python layout; PyObjC bridges str, int and
+        # float values when the dictionary is converted below
+        plist_data = self.create_data_dict(script_text, filename)
 
-        # GUI - 40 bytes
-        plist_data['GUI'] = NSData.dataWithBytes_length_(
-            DEFAULT_GUI_BYTES, len(DEFAULT_GUI_BYTES)
-        )
+        # Binary fields keep their explicit NSMutableData/NSData classes
+        code_bytes = plist_data['CODE']
+        plist_data['CODE'] = NSMutableData.dataWithBytes_length_(code_bytes, len(code_bytes))
+        plist_data['data'] = NSMutableData.data()
+        plist_data['GUI'] = _NS_GUI
+        for key, ns_variable in zip(VARIABLE_KEYS, _NS_VARIABLES):
+            plist_data[key] = ns_variable
 
-        # Strings
-        plist_data['FILENAME'] = NSString.stringWithString_(filename)
-        plist_data['KNOBTITLE'] = NSString.stringWithString_('Chord Sequence')
-        plist_data['PADTITLE'] = NSString.stringWithString_('')
-        plist_data['XYTITLE'] = NSString.stringWithString_('')
-
-        # Integers (as NSNumber)
-        plist_data['manufacturer'] = NSNumber.numberWithInt_(FOURCC_MANUFACTURER)
-        plist_data['subtype'] = NSNumber.numberWithInt_(FOURCC_SUBTYPE)
-        plist_data['type'] = NSNumber.numberWithInt_(FOURCC_TYPE)
-        plist_data['version'] = NSNumber.numberWithInt_(DEFAULT_VERSION)
-        plist_data['SCALE'] = NSNumber.numberWithInt_(DEFAULT_SCALE)
-
-        # Knob values (0-21)
-        for i in range(NUM_KNOBS):
-            plist_data[f'KNOBVALUE{i}'] = NSNumber.numberWithDouble_(0.0)
-
-        # Knob labels (0-21)
-        for i in range(NUM_KNOBS):
-            plist_data[f'KNOBLABEL{i}'] = NSString.stringWithString_(f'Knob {i}')
-
-        # Audio Unit values (0-7)
-        for i, val in enumerate(DEFAULT_AU_VALUES):
-            plist_data[f'AUVALUE{i}'] = NSNumber.numberWithDouble_(val)
-
-        # Variables (0-5) - 16-byte binary values
-        for i in range(NUM_VARIABLES):
-            plist_data[f'VARIABLE{i}'] = NSData.dataWithBytes_length_(
-                DEFAULT_VARIABLE_BYTES, len(DEFAULT_VARIABLE_BYTES)
-            )
-
-        # XY Pad values
-        plist_data['XVALUE'] = NSNumber.numberWithDouble_(0.0)
-        plist_data['YVALUE'] = NSNumber.numberWithDouble_(0.0)
-
-        # data field (empty NSMutableData)
-        empty_data = NSMutableData.data()
-        plist_data['data'] = empty_data
+        # One bridge crossing for the whole dictionary
+        plist_data = NSMutableDictionary.dictionaryWithDictionary_(plist_data)
 
         # Archive using native NSKeyedArchiver
         archived_data, error = FoundationNSKeyedArchiver.archivedDataWithRootObject_requiringSecureCoding_error_(
@@ -427,8 +600,58 @@ class MozaicEncoder:
         """
         if self.use_foundation:
             return self.encode_foundation(script_text, filename)
-        else:
+        elif self.use_plistlib:
             return self.encode_pure_python(script_text, filename)
+        else:
+            return self.encode_stream(script_text, filename)
+
+
+class MozaicTemplate:
+    """
+    Encoded .mozaic file for one filename, reused for any CODE.
+
+    Every field except CODE is fixed once the filename is chosen, so the
+    file is encoded once with a placeholder script and each encode() only
+    splices in the new CODE bytes and shifts the offsets after it. Output
+    is identical to MozaicEncoder().encode_stream().
+    """
+
+    def __init__(self, filename: str = "chordSequence"):
+        """
+        Encode the template for filename.
+
+        Args:
+            filename: Filename to embed
+        """
+        self.filename = filename
+        self._encoder = MozaicEncoder()
+        self._template = BinaryPlistTemplate(
+            self._encoder.archive(_SKELETON_CODE.decode('utf-8'), filename),
+            _SKELETON_CODE
+        )
+
+    def encode(self, code_bytes: bytes) -> bytes:
+        """
+        Encode a .mozaic file with the given UTF-8 script bytes.
+
+        Args:
+            code_bytes: Encoded Mozaic script
+
+        Returns:
+            Binary plist bytes
+        """
+        encoded = self._template.dumps(code_bytes)
+        if encoded is None:
+            # Offset table width changed, or CODE equals another data field
+            plist = self._encoder.archive(code_bytes.decode('utf-8'), self.filename)
+            encoded = dumps_binary(plist)
+        return encoded
+
+
+@lru_cache(maxsize=16)
+def _mozaic_template(filename: str) -> MozaicTemplate:
+    """Return the shared MozaicTemplate for filename."""
+    return MozaicTemplate(filename)
 
 
 def create_mozaic_file(script_text: str,
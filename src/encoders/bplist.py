@@ -0,0 +1,416 @@
+"""
+Binary property list writer for NSKeyedArchiver archives.
+
+This module provides a direct binary plist (bplist00) writer for the
+subset of plist types used by Mozaic archives. Its output is
+byte-identical to ``plistlib.dumps(value, fmt=plistlib.FMT_BINARY)``,
+but objects are encoded into a list of byte strings that is joined once
+at the end, and child references are resolved once while flattening, instead of going through plistlib's
+file-like writer and re-sorting every dictionary on output.
+"""
+
+import struct
+from plistlib import UID
+from typing import Any, Dict, List, Optional, Tuple
+
+# Try to import libplist's Python bindings for compiled encoding (optional)
+try:
+    import plist as _libplist
+    LIBPLIST_AVAILABLE = hasattr(_libplist, 'dumps') and hasattr(_libplist, 'FMT_BINARY')
+except ImportError:
+    _libplist = None
+    LIBPLIST_AVAILABLE = False
+
+# The bindings' own UID node type (named Uid in libplist's Cython module)
+_LIBPLIST_UID = getattr(_libplist, 'UID', None) or getattr(_libplist, 'Uid', None)
+
+# Types deduplicated by value (everything else is deduplicated by identity)
+_SCALARS = (str, int, float, bytes)
+
+# struct format character for each reference/offset width
+_BINARY_FORMAT = {1: 'B', 2: 'H', 4: 'L', 8: 'Q'}
+
+_TRAILER_FORMAT = '>5xBBBQQQ'
+_TRAILER_SIZE = struct.calcsize(_TRAILER_FORMAT)
+_pack_trailer = struct.Struct(_TRAILER_FORMAT).pack
+
+# Fixed-layout packers, compiled once: marker byte(s) + value
+_pack_BB = struct.Struct('>BB').pack
+_pack_BH = struct.Struct('>BH').pack
+_pack_BL = struct.Struct('>BL').pack
+_pack_BQ = struct.Struct('>BQ').pack
+_pack_Bq = struct.Struct('>Bq').pack
+_pack_Bd = struct.Struct('>Bd').pack
+_pack_BBB = struct.Struct('>BBB').pack
+_pack_BBH = struct.Struct('>BBH').pack
+_pack_BBL = struct.Struct('>BBL').pack
+_pack_BBQ = struct.Struct('>BBQ').pack
+
+
+def _pack_refs(ref_format: str, refs) -> bytes:
+    """Pack a sequence of object references (or offsets) big-endian."""
+    if ref_format == 'B':
+        # One byte per reference: no format string to build or parse
+        return bytes(refs)
+    return struct.pack(f'>{len(refs)}{ref_format}', *refs)
+
+
+def _count_to_size(count: int) -> int:
+    """Return the number of bytes needed to store references up to count."""
+    if count < 1 << 8:
+        return 1
+    elif count < 1 << 16:
+        return 2
+    elif count < 1 << 32:
+        return 4
+    else:
+        return 8
+
+
+class BinaryPlistWriter:
+    """
+    Serialize a plist object graph to binary plist bytes.
+
+    Object numbering follows plistlib exactly (pre-order walk, dictionary
+    keys sorted, keys flattened before values), so files produced here are
+    interchangeable with the plistlib-based encoder.
+    """
+
+    def __init__(self):
+        """Initialize an empty writer."""
+        # Flattened object list, indexed by reference number
+        self._objects: List[Any] = []
+
+        # Reference lookups: scalars by (type, value), containers by id()
+        self._scalar_refs: Dict[Tuple[type, Any], int] = {}
+        self._container_refs: Dict[int, int] = {}
+
+        # Resolved child references for containers, keyed by reference number
+        self._children: Dict[int, Tuple[List[int], ...]] = {}
+
+        # Byte offset of each object, filled in by dumps()
+        self._offsets: List[int] = []
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Serialize a plist object graph.
+
+        Args:
+            value: Root plist object (dict, list, str, int, float, bytes, UID)
+
+        Returns:
+            Binary plist bytes
+
+        Raises:
+            TypeError: If the graph contains an unsupported type
+        """
+        top_object = self._flatten(value)
+
+        num_objects = len(self._objects)
+        ref_format = _BINARY_FORMAT[_count_to_size(num_objects)]
+
+        # Encoded pieces are collected and joined once; offsets are known
+        # from the running length before the join
+        parts = [b'bplist00']
+        append = parts.append
+        offset = 8
+        offsets = self._offsets = [0] * num_objects
+
+        size_marker = self._size_marker
+        encode_object = self._encode_object
+
+        for ref, obj in enumerate(self._objects):
+            offsets[ref] = offset
+            if type(obj) is bytes:
+                # Data payloads (e.g. CODE) can be large: keep them as their
+                # own part instead of copying them into marker + data
+                marker = size_marker(0x40, len(obj))
+                append(marker)
+                append(obj)
+                offset += len(marker) + len(obj)
+            else:
+                encoded = encode_object(ref, obj, ref_format)
+                append(encoded)
+                offset += len(encoded)
+
+        # Offset table and trailer
+        offset_table_offset = offset
+        offset_size = _count_to_size(offset_table_offset)
+        append(_pack_refs(_BINARY_FORMAT[offset_size], offsets))
+        append(_pack_trailer(
+            0, offset_size, _count_to_size(num_objects), num_objects,
+            top_object, offset_table_offset
+        ))
+
+        return b''.join(parts)
+
+    def _flatten(self, value: Any) -> int:
+        """Assign reference numbers to value and its children; return its ref."""
+        if isinstance(value, _SCALARS):
+            key = (type(value), value)
+            ref = self._scalar_refs.get(key)
+            if ref is not None:
+                return ref
+            ref = len(self._objects)
+            self._objects.append(value)
+            self._scalar_refs[key] = ref
+            return ref
+
+        ref = self._container_refs.get(id(value))
+        if ref is not None:
+            return ref
+
+        ref = len(self._objects)
+        self._objects.append(value)
+        self._container_refs[id(value)] = ref
+
+        if isinstance(value, dict):
+            items = sorted(value.items())
+            for k, _ in items:
+                if not isinstance(k, str):
+                    raise TypeError("keys must be strings")
+            key_refs = [self._flatten(k) for k, _ in items]
+            value_refs = [self._flatten(v) for _, v in items]
+            self._children[ref] = (key_refs, value_refs)
+        elif isinstance(value, (list, tuple)):
+            self._children[ref] = ([self._flatten(o) for o in value],)
+
+        return ref
+
+    @staticmethod
+    def _size_marker(token: int, size: int) -> bytes:
+        """Return an object marker with its length."""
+        if size < 15:
+            return bytes((token | size,))
+        elif size < 1 << 8:
+            return _pack_BBB(token | 0xF, 0x10, size)
+        elif size < 1 << 16:
+            return _pack_BBH(token | 0xF, 0x11, size)
+        elif size < 1 << 32:
+            return _pack_BBL(token | 0xF, 0x12, size)
+        else:
+            return _pack_BBQ(token | 0xF, 0x13, size)
+
+    def _encode_object(self, ref: int, value: Any, ref_format: str) -> bytes:
+        """Return the encoding of a single scalar or flattened container."""
+        if value is None:
+            return b'\x00'
+
+        elif value is False:
+            return b'\x08'
+
+        elif value is True:
+            return b'\x09'
+
+        elif isinstance(value, int):
+            if value < 0:
+                try:
+                    return _pack_Bq(0x13, value)
+                except struct.error:
+                    raise OverflowError(value) from None
+            elif value < 1 << 8:
+                return _pack_BB(0x10, value)
+            elif value < 1 << 16:
+                return _pack_BH(0x11, value)
+            elif value < 1 << 32:
+                return _pack_BL(0x12, value)
+            elif value < 1 << 63:
+                return _pack_BQ(0x13, value)
+            elif value < 1 << 64:
+                return b'\x14' + value.to_bytes(16, 'big', signed=True)
+            else:
+                raise OverflowError(value)
+
+        elif isinstance(value, float):
+            return _pack_Bd(0x23, value)
+
+        elif isinstance(value, bytes):
+            return self._size_marker(0x40, len(value)) + value
+
+        elif isinstance(value, str):
+            try:
+                encoded = value.encode('ascii')
+                return self._size_marker(0x50, len(value)) + encoded
+            except UnicodeEncodeError:
+                encoded = value.encode('utf-16be')
+                return self._size_marker(0x60, len(encoded) // 2) + encoded
+
+        elif isinstance(value, UID):
+            if value.data < 0:
+                raise ValueError("UIDs must be positive")
+            elif value.data < 1 << 8:
+                return _pack_BB(0x80, value.data)
+            elif value.data < 1 << 16:
+                return _pack_BH(0x81, value.data)
+            elif value.data < 1 << 32:
+                return _pack_BL(0x83, value.data)
+            elif value.data < 1 << 64:
+                return _pack_BQ(0x87, value.data)
+            else:
+                raise OverflowError(value)
+
+        elif isinstance(value, (list, tuple)):
+            (refs,) = self._children[ref]
+            return self._size_marker(0xA0, len(refs)) + _pack_refs(ref_format, refs)
+
+        elif isinstance(value, dict):
+            key_refs, value_refs = self._children[ref]
+            count = len(key_refs)
+            return (self._size_marker(0xD0, count)
+                    + _pack_refs(ref_format, key_refs + value_refs))
+
+        else:
+            raise TypeError(f"unsupported type: {type(value)}")
+
+
+class BinaryPlistTemplate:
+    """
+    Binary plist in which one bytes object can be replaced without
+    re-serializing the rest of the graph.
+
+    The plist is written once with a placeholder payload. dumps() then
+    splices in the new payload and shifts the offsets of every object
+    written after it, which is all that changes as long as the offset
+    table keeps its width and the new payload does not deduplicate
+    against another bytes object.
+    """
+
+    def __init__(self, value: Any, placeholder: bytes):
+        """
+        Serialize value once and record the layout around placeholder.
+
+        Args:
+            value: Root plist object containing placeholder exactly once
+                   as a bytes value
+            placeholder: Bytes payload to be replaced on each dumps() call
+
+        Raises:
+            ValueError: If placeholder does not occur in value
+        """
+        writer = BinaryPlistWriter()
+        data = writer.dumps(value)
+
+        ref = writer._scalar_refs.get((bytes, placeholder))
+        if ref is None:
+            raise ValueError("placeholder not found in plist")
+
+        # A payload equal to any of these would share its object
+        self._other_data = frozenset(
+            v for t, v in writer._scalar_refs if t is bytes and v != placeholder
+        )
+
+        (_, self._offset_size, self._ref_size, self._num_objects,
+         self._top_object, self._table_offset) = struct.unpack(
+            _TRAILER_FORMAT, data[-_TRAILER_SIZE:]
+        )
+
+        offsets = writer._offsets
+        start = offsets[ref]
+        end = offsets[ref + 1] if ref + 1 < self._num_objects else self._table_offset
+
+        self._head = data[:start]
+        self._tail = data[end:self._table_offset]
+        self._placeholder_size = end - start
+        self._head_offsets = offsets[:ref + 1]
+        self._tail_offsets = offsets[ref + 1:]
+
+    def dumps(self, payload: bytes) -> Optional[bytes]:
+        """
+        Return the plist bytes with payload in place of the placeholder.
+
+        The result is identical to serializing the original value with the
+        placeholder replaced by payload.
+
+        Args:
+            payload: New bytes value
+
+        Returns:
+            Binary plist bytes, or None if the layout would change (the
+            offset table needs a different width, or payload equals another
+            bytes object) and the plist must be serialized in full
+        """
+        if payload in self._other_data:
+            return None
+
+        marker = BinaryPlistWriter._size_marker(0x40, len(payload))
+        delta = len(marker) + len(payload) - self._placeholder_size
+
+        table_offset = self._table_offset + delta
+        offset_size = _count_to_size(table_offset)
+        if offset_size != self._offset_size:
+            return None
+
+        table = _pack_refs(
+            _BINARY_FORMAT[offset_size],
+            self._head_offsets + [o + delta for o in self._tail_offsets]
+        )
+        trailer = _pack_trailer(
+            0, offset_size, self._ref_size, self._num_objects,
+            self._top_object, table_offset
+        )
+        return b''.join((self._head, marker, payload, self._tail, table, trailer))
+
+
+def dumps_binary(value: Any) -> bytes:
+    """
+    Serialize a plist object graph to binary plist bytes.
+
+    Drop-in replacement for ``plistlib.dumps(value, fmt=plistlib.FMT_BINARY)``
+    for the types used by NSKeyedArchiver archives.
+
+    Args:
+        value: Root plist object
+
+    Returns:
+        Binary plist bytes
+    """
+    return BinaryPlistWriter().dumps(value)
+
+
+def dumps_binary_cext(value: Any) -> bytes:
+    """
+    Serialize a plist object graph using libplist's compiled writer.
+
+    The result is a valid binary plist with the same contents, but object
+    order (and therefore the exact bytes) may differ from dumps_binary().
+    plistlib.UID values are converted to the bindings' UID type; if the
+    bindings have no UID type or reject the converted graph, this falls
+    back to dumps_binary().
+
+    Args:
+        value: Root plist object
+
+    Returns:
+        Binary plist bytes
+
+    Raises:
+        RuntimeError: If libplist bindings are not installed
+    """
+    if not LIBPLIST_AVAILABLE:
+        raise RuntimeError("libplist Python bindings not available")
+
+    if _LIBPLIST_UID is None:
+        return dumps_binary(value)
+    try:
+        return bytes(_libplist.dumps(_to_libplist(value, {}), fmt=_libplist.FMT_BINARY))
+    except (TypeError, ValueError):
+        return dumps_binary(value)
+
+
+def _to_libplist(value: Any, memo: Dict[int, Any]) -> Any:
+    """Copy a plist graph, replacing plistlib.UID with libplist's UID type.
+
+    Containers are memoized by identity so shared objects stay shared.
+    """
+    if isinstance(value, UID):
+        return _LIBPLIST_UID(value.data)
+    if not isinstance(value, (dict, list, tuple)):
+        return value
+    converted = memo.get(id(value))
+    if converted is None:
+        if isinstance(value, dict):
+            converted = {k: _to_libplist(v, memo) for k, v in value.items()}
+        else:
+            converted = [_to_libplist(v, memo) for v in value]
+        memo[id(value)] = converted
+    return converted
@@ -5,14 +5,90 @@ This module provides the core functionality for generating Mozaic chord
 sequence scripts from song files.
 """
 
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 from .models import Song, SongCollection, Bar, ScriptContext
-from .templates import TemplateManager
 from .encoders import MozaicEncoder, create_mozaic_file
 from .chord_notes import midi_to_note_name
 
 
+@lru_cache(maxsize=None)
+def _beat_offsets(num_chords: int) -> Tuple[Tuple[float, Union[int, float], str], ...]:
+    """
+    Return the beat offset of each chord in a bar of num_chords chords.
+
+    Each entry is (offset, label_offset, spec): offset is the float beat
+    offset, and label_offset/spec are what the position label is formatted
+    from - the offset as an int with 'd' when it falls on a whole beat,
+    and the float itself with 'g' otherwise.
+    """
+    step = 8 / num_chords
+    offsets = []
+    for i in range(num_chords):
+        beat_offset = i * step
+        if beat_offset.is_integer():
+            offsets.append((beat_offset, int(beat_offset), 'd'))
+        else:
+            offsets.append((beat_offset, beat_offset, 'g'))
+    return tuple(offsets)
+
+
+def generate_update_block_from_bars(bars: List[List[str]], song_index: int) -> str:
+    """
+    Generate the @UpdateChordsSong{n} block from raw chord lists.
+
+    Same output as generate_update_block(), but works directly on lists of
+    chord symbols, skipping Song/Bar model construction (and the chord note
+    lookups it triggers) when only the block text is needed.
+
+    Args:
+        bars: List of bars, each a list of chord symbols
+        song_index: Zero-based index of the song
+
+    Returns:
+        Mozaic script block as string
+
+    Raises:
+        ValueError: If bars is empty
+
+    Example:
+        >>> block = generate_update_block_from_bars([["C", "F"], ["G"]], 0)
+        >>> "LabelPad 4 - bar*8, {F}" in block
+        True
+    """
+    if not bars:
+        raise ValueError("At least one bar is required")
+
+    # Add first bar at end for lookahead (iterated, not copied)
+    bars_with_repeat = chain(bars, (bars[0],))
+
+    lines = [f"@UpdateChordsSong{song_index}"]
+    append = lines.append
+
+    # Generate chord labels
+    pad_index = 0
+    for chords in bars_with_repeat:
+        if not chords:
+            pad_index += 1
+            continue
+
+        base = pad_index * 8
+        for chord, (_, label_offset, spec) in zip(chords, _beat_offsets(len(chords))):
+            # Integer if whole, float otherwise - the spec was chosen up front
+            append(f"  LabelPad {base + label_offset:{spec}} - bar*8, {{{chord}}}")
+
+        pad_index += 1
+
+    lines.append("@End\n")
+    return "\n".join(lines)
+
+
 def generate_update_block(song: Song, song_index: int) -> Tuple[str, List[float]]:
     """
     Generate the @UpdateChordsSong{n} block for a song.
@@ -35,55 +111,47 @@ def generate_update_block(song: Song, song_index: int) -> Tuple[str, List[float]
         >>> "@UpdateChordsSong0" in block
         True
     """
-    # Add first bar at end for lookahead
-    bars_with_repeat = list(song.bars) + [song.bars[0]]
-
     lines = [f"@UpdateChordsSong{song_index}"]
+    append = lines.append
 
-    # Collect fill positions for this song
+    # Chord labels and fill positions, collected in one walk over the bars
     fill_positions = []
     pad_index = 0
 
-    for bar_idx, bar in enumerate(song.bars):
-        if not bar.chords:
+    for bar in song.bars:
+        chords = bar.chords
+        if not chords:
             pad_index += 1
             continue
 
-        num_chords = len(bar)
-        for i, (chord, has_fill) in enumerate(zip(bar.chords, bar.fills)):
+        base = pad_index * 8
+        for chord, has_fill, (beat_offset, label_offset, spec) in zip(
+            chords, bar.fills, _beat_offsets(len(chords))
+        ):
+            append(f"  LabelPad {base + label_offset:{spec}} - bar*8, {{{chord}}}")
             if has_fill:
-                # Calculate beat offset within the bar
-                beat_offset = i * (8 / num_chords)
-                pos_val = pad_index * 8 + beat_offset
-                fill_positions.append(pos_val)
+                fill_positions.append(base + beat_offset)
 
         pad_index += 1
 
-    # Generate chord labels
-    pad_index = 0
-    for bar in bars_with_repeat:
-        if not bar.chords:
-            pad_index += 1
-            continue
+    # Repeat the first bar's labels at the end for lookahead (no fills)
+    chords = song.bars[0].chords
+    if chords:
+        base = pad_index * 8
+        for chord, (_, label_offset, spec) in zip(chords, _beat_offsets(len(chords))):
+            append(f"  LabelPad {base + label_offset:{spec}} - bar*8, {{{chord}}}")
 
-        num_chords = len(bar)
-        for i, chord in enumerate(bar.chords):
-            # Calculate beat offset within the bar
-            beat_offset = i * (8 / num_chords)
-            pos_val = pad_index * 8 + beat_offset
+    append("@End\n")
+    return "\n".join(lines), fill_positions
 
-            # Format position (integer if whole, float otherwise)
-            if pos_val.is_integer():
-                pos_str = f"{int(pos_val)}"
-            else:
-                pos_str = f"{pos_val:g}"
 
-            lines.append(f"  LabelPad {pos_str} - bar*8, {{{chord}}}")
+# Rendered scripts kept per generator (each entry holds a whole script)
+_SCRIPT_CACHE_SIZE = 8
 
-        pad_index += 1
 
-    lines.append("@End\n")
-    return "\n".join(lines), fill_positions
+def _songs_digest(songs: SongCollection) -> bytes:
+    """Content digest of everything in songs the script is rendered from."""
+    return hashlib.blake2b(songs.model_dump_json().encode('utf-8'), digest_size=16).digest()
 
 
 class ChordSequenceGenerator:
@@ -109,13 +177,25 @@ class ChordSequenceGenerator:
             template_dir: Optional custom template directory
             use_foundation: Whether to use Foundation encoding (macOS only)
         """
+        # Imported here so song loading/ordering doesn't require Jinja2
+        from .templates import TemplateManager
+
+        self.template_dir = template_dir
         self.template_manager = TemplateManager(template_dir)
         self.encoder = MozaicEncoder(use_foundation=use_foundation)
 
+        # Digest of the songs -> rendered script, most recently used last
+        self._script_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
     def generate_script(self, songs: SongCollection) -> str:
         """
         Generate complete Mozaic script from song collection.
 
+        Rendering is deterministic in the songs, so the last few scripts are
+        kept keyed on a digest of the collection's contents; generating the
+        same songs again (e.g. re-exporting unchanged files) skips the
+        update blocks and the template render.
+
         Args:
             songs: SongCollection with songs to include
 
@@ -131,9 +211,62 @@ class ChordSequenceGenerator:
             >>> "@OnLoad" in script
             True
         """
-        # Build context for template rendering
+        cache = self._script_cache
+        key = _songs_digest(songs)
+        script = cache.get(key)
+        if script is not None:
+            cache.move_to_end(key)
+            return script
+
+        script = self.template_manager.render('chord_sequence.mozaic.j2', self._template_context(songs))
+        cache[key] = script
+        if len(cache) > _SCRIPT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return script
+
+    def generate_script_to(self, songs: SongCollection, fp) -> int:
+        """
+        Stream the complete Mozaic script to a text file-like object.
+
+        Same output as generate_script(), but written chunk by chunk as the
+        template renders, without building the whole script in memory.
+
+        Args:
+            songs: SongCollection with songs to include
+            fp: Text file-like object to write to
+
+        Returns:
+            Number of lines written (as len(script.splitlines()) would give)
+        """
+        template = self.template_manager.load_template('chord_sequence.mozaic.j2')
+        write = fp.write
+
+        newlines = 0
+        last_chunk = ''
+        for chunk in template.generate(**self._template_context(songs)):
+            if chunk:
+                write(chunk)
+                newlines += chunk.count('\n')
+                last_chunk = chunk
+
+        # A final line without a trailing newline still counts
+        return newlines + (1 if last_chunk and not last_chunk.endswith('\n') else 0)
+
+    def _template_context(self, songs: SongCollection) -> dict:
+        """Build the chord_sequence.mozaic.j2 rendering context for songs."""
         template_songs = []
 
+        # Note names per distinct voicing - songbooks reuse a few chords, so
+        # each voicing is converted once per collection, not per occurrence
+        note_name_table = {}
+
+        def note_names_for(midi_notes: List[int]) -> List[str]:
+            key = tuple(midi_notes)
+            names = note_name_table.get(key)
+            if names is None:
+                names = note_name_table[key] = [midi_to_note_name(midi) for midi in key]
+            return names
+
         for idx, song in enumerate(songs):
             # Generate update block and get fill positions
             update_block, fill_positions = generate_update_block(song, idx)
@@ -150,8 +283,8 @@ class ChordSequenceGenerator:
                     zip(bar.chords, bar.chord_notes, bar.simplified_chord_notes)
                 ):
                     # Convert MIDI notes to human-readable names
-                    note_names = [midi_to_note_name(midi) for midi in chord_notes] if chord_notes else []
-                    simplified_note_names = [midi_to_note_name(midi) for midi in simplified_notes] if simplified_notes else []
+                    note_names = note_names_for(chord_notes)
+                    simplified_note_names = note_names_for(simplified_notes)
 
                     bar_info['chords'].append({
                         'chord_index': chord_idx,
@@ -175,11 +308,7 @@ class ChordSequenceGenerator:
                 'chord_structure': chord_structure
             })
 
-        # Render template
-        context = {'songs': template_songs}
-        script = self.template_manager.render('chord_sequence.mozaic.j2', context)
-
-        return script
+        return {'songs': template_songs}
 
     def generate_mozaic_file(self,
                             songs: SongCollection,
@@ -214,6 +343,63 @@ class ChordSequenceGenerator:
         with open(output_path, 'wb') as f:
             f.write(mozaic_bytes)
 
+    def generate_mozaic_files_batch(self,
+                                    jobs: List[Tuple[SongCollection, Path]],
+                                    max_workers: Optional[int] = None) -> None:
+        """
+        Generate several .mozaic files, rendering and encoding in parallel.
+
+        Each (songs, output_path) job is independent and CPU bound, so the
+        work is spread over worker processes; the files are written here,
+        in job order, once their bytes come back. Output is the same as
+        calling generate_mozaic_file() for each job.
+
+        Args:
+            jobs: List of (songs, output_path) pairs; the embedded filename
+                  is each output_path stem
+            max_workers: Worker process count (default: one per CPU,
+                         at most one per job)
+        """
+        if not jobs:
+            return
+
+        if max_workers is None:
+            max_workers = min(len(jobs), os.cpu_count() or 1)
+
+        if max_workers <= 1:
+            # Not worth starting a pool
+            for songs, output_path in jobs:
+                self.generate_mozaic_file(songs, output_path)
+            return
+
+        work = [
+            (self.template_dir, self.encoder, songs, output_path.stem)
+            for songs, output_path in jobs
+        ]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for (_, output_path), mozaic_bytes in zip(jobs, executor.map(_render_mozaic, work)):
+                with open(output_path, 'wb') as f:
+                    f.write(mozaic_bytes)
+
+
+@lru_cache(maxsize=4)
+def _worker_generator(template_dir: Optional[Path]) -> ChordSequenceGenerator:
+    """Return this process's generator for template_dir (built once)."""
+    return ChordSequenceGenerator(template_dir)
+
+
+def _render_mozaic(job) -> bytes:
+    """
+    Batch worker: render and encode one song collection to .mozaic bytes.
+
+    The job carries the calling generator's encoder, so every encoder
+    setting (deduplication, backend) applies in the worker too.
+    """
+    template_dir, encoder, songs, filename = job
+    script_text = _worker_generator(template_dir).generate_script(songs)
+    return encoder.encode(script_text, filename)
+
 
 def load_songs_from_directory(directory: Path,
                               pattern: str = "*.txt",
@@ -269,10 +455,9 @@ def read_song_index(index_file: Path) -> List[str]:
     if not index_file.exists():
         return []
 
-    with open(index_file, 'r', encoding='utf-8') as f:
-        lines = [line.strip() for line in f if line.strip()]
+    content = index_file.read_bytes().decode('utf-8')
 
-    return lines
+    return [name for name in map(str.strip, content.splitlines()) if name]
 
 
 def write_song_index(index_file: Path, filenames: List[str]) -> None:
@@ -283,9 +468,15 @@ def write_song_index(index_file: Path, filenames: List[str]) -> None:
         index_file: Path to .songs.index file
         filenames: List of song filenames (basenames only)
     """
-    with open(index_file, 'w', encoding='utf-8') as f:
-        for filename in filenames:
-            f.write(f"{filename}\n")
+    # Serialize the whole index up front and write it with a raw descriptor
+    content = memoryview("".join(f"{filename}\n" for filename in filenames).encode('utf-8'))
+
+    fd = os.open(index_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while content:
+            content = content[os.write(fd, content):]
+    finally:
+        os.close(fd)
 
 
 def resolve_song_order(current_files: List[Path],
@@ -5,6 +5,8 @@ This module provides Pydantic models for type-safe data handling throughout
 the application, replacing dictionary-based data structures.
 """
 
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import List, Optional
 from pydantic import BaseModel, Field, field_validator, computed_field
@@ -162,69 +164,69 @@ class Song(BaseModel):
             ValueError: If file is empty or has no bars
         """
         with open(path, "r", encoding="utf-8") as f:
-            lines = [line.strip() for line in f.readlines() if line.strip()]
-
-        if not lines:
-            raise ValueError(f"Empty song file: {path}")
-
-        title = lines[0]
-        tempo = None
-        rhythm_bank = None
-        rhythm_number = None
-        bar_start_index = 1
-
-        # Detect optional tempo line
-        if len(lines) > 1 and lines[1].lower().startswith("tempo="):
-            try:
-                tempo = int(lines[1].split("=", 1)[1])
-            except ValueError:
-                raise ValueError(f"Invalid tempo format in file: {path}")
-            bar_start_index = 2
-
-        # Detect optional rhythm line
-        if len(lines) > bar_start_index and lines[bar_start_index].lower().startswith("rhythm "):
-            try:
-                parts = lines[bar_start_index].split()
-                if len(parts) != 3:
-                    raise ValueError(f"Invalid rhythm format (expected 'rhythm <bank> <number>'): {path}")
-                rhythm_bank = int(parts[1])
-                rhythm_number = int(parts[2])
-            except ValueError as e:
-                raise ValueError(f"Invalid rhythm format in file: {path} - {e}")
-            bar_start_index += 1
-
-        # Parse bars with fill markers
-        bar_lines = lines[bar_start_index:]
-        if not bar_lines:
-            raise ValueError(f"No bars found in song file: {path}")
-
-        bars = []
-        for line in bar_lines:
-            tokens = line.split()
-            chords = []
-            fills = []
-
-            i = 0
-            while i < len(tokens):
-                token = tokens[i]
-
-                # Check if next token is a fill marker
-                if i + 1 < len(tokens) and tokens[i + 1] == '*':
-                    chords.append(token)
-                    fills.append(True)
-                    i += 2  # Skip the '*'
-                elif token == '*':
-                    # Standalone '*' - attach to previous chord
-                    if chords and not fills[-1]:
-                        fills[-1] = True
-                    i += 1
-                else:
-                    chords.append(token)
-                    fills.append(False)
-                    i += 1
-
-            if chords:  # Only create bar if it has chords
-                bars.append(Bar(chords=chords, fills=fills))
+            # Stream stripped, non-blank lines straight from the file
+            lines = filter(None, map(str.strip, f))
+
+            title = next(lines, None)
+            if title is None:
+                raise ValueError(f"Empty song file: {path}")
+
+            tempo = None
+            rhythm_bank = None
+            rhythm_number = None
+            line = next(lines, None)
+
+            # Detect optional tempo line
+            if line is not None and line.lower().startswith("tempo="):
+                try:
+                    tempo = int(line.split("=", 1)[1])
+                except ValueError:
+                    raise ValueError(f"Invalid tempo format in file: {path}")
+                line = next(lines, None)
+
+            # Detect optional rhythm line
+            if line is not None and line.lower().startswith("rhythm "):
+                try:
+                    parts = line.split()
+                    if len(parts) != 3:
+                        raise ValueError(f"Invalid rhythm format (expected 'rhythm <bank> <number>'): {path}")
+                    rhythm_bank = int(parts[1])
+                    rhythm_number = int(parts[2])
+                except ValueError as e:
+                    raise ValueError(f"Invalid rhythm format in file: {path} - {e}")
+                line = next(lines, None)
+
+            # Parse bars with fill markers
+            if line is None:
+                raise ValueError(f"No bars found in song file: {path}")
+
+            bars = []
+            for line in chain((line,), lines):
+                tokens = line.split()
+                chords = []
+                fills = []
+
+                i = 0
+                while i < len(tokens):
+                    token = tokens[i]
+
+                    # Check if next token is a fill marker
+                    if i + 1 < len(tokens) and tokens[i + 1] == '*':
+                        chords.append(token)
+                        fills.append(True)
+                        i += 2  # Skip the '*'
+                    elif token == '*':
+                        # Standalone '*' - attach to previous chord
+                        if chords and not fills[-1]:
+                            fills[-1] = True
+                        i += 1
+                    else:
+                        chords.append(token)
+                        fills.append(False)
+                        i += 1
+
+                if chords:  # Only create bar if it has chords
+                    bars.append(Bar(chords=chords, fills=fills))
 
         return cls(
             title=title,
@@ -235,6 +237,33 @@ class Song(BaseModel):
             source_file=path
         )
 
+    @classmethod
+    def from_file_cached(cls, path: Path) -> "Song":
+        """
+        Create a Song from a chord file, reusing the parse while it is unchanged.
+
+        Results are memoized per process by (path, mtime, size), so editing
+        the file invalidates its entry.
+
+        Args:
+            path: Path to the song chord file
+
+        Returns:
+            Song instance (shared between calls - do not mutate)
+
+        Raises:
+            ValueError: If file is empty or has no bars
+        """
+        path = Path(path)
+        st = path.stat()
+        return _load_song(path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=256)
+def _load_song(path: Path, mtime_ns: int, size: int) -> Song:
+    """Parse a song file; mtime and size are part of the cache key only."""
+    return Song.from_file(path)
+
 
 class SongCollection(BaseModel):
     """
@@ -271,6 +300,12 @@ class SongCollection(BaseModel):
         """Check if any songs have tempo defined."""
         return any(song.has_tempo for song in self.songs)
 
+    @computed_field
+    @property
+    def total_bars(self) -> int:
+        """Total number of bars across all songs."""
+        return sum(song.num_bars for song in self.songs)
+
     def add_song(self, song: Song) -> None:
         """
         Add a song to the collection.
@@ -5,6 +5,7 @@ This module provides the TemplateManager class for loading and rendering
 Jinja2 templates for Mozaic scripts.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
@@ -115,6 +116,21 @@ class TemplateManager:
         return self.env.list_templates()
 
 
+@lru_cache(maxsize=1)
+def get_default_manager() -> TemplateManager:
+    """
+    Return a shared TemplateManager for the default template directory.
+
+    The manager (and its Jinja2 environment, which caches compiled
+    templates) is created once per process, so repeated renders only
+    pay the render cost.
+
+    Returns:
+        Process-wide TemplateManager instance
+    """
+    return TemplateManager()
+
+
 # Convenience function for quick rendering
 def render_chord_sequence(songs: List[Dict[str, Any]]) -> str:
     """
@@ -144,5 +160,5 @@ def render_chord_sequence(songs: List[Dict[str, Any]]) -> str:
         ... ]
         >>> script = render_chord_sequence(songs)
     """
-    manager = TemplateManager()
+    manager = get_default_manager()
     return manager.render('chord_sequence.mozaic.j2', {'songs': songs})
@@ -75,6 +75,15 @@ class TestParseChordFile(unittest.TestCase):
             csg.parse_chord_file(song_file)
         self.assertIn("tempo", str(context.exception).lower())
 
+    def test_parse_reflects_file_changes(self):
+        """Test that memoized parsing picks up edits to the file."""
+        song_file = Path(self.test_dir) / "edited.txt"
+        song_file.write_text("Song\nC G\n")
+        self.assertEqual(csg.parse_chord_file(song_file)[2], [['C', 'G']])
+
+        song_file.write_text("Song\nC G Am F\n")
+        self.assertEqual(csg.parse_chord_file(song_file)[2], [['C', 'G', 'Am', 'F']])
+
 
 class TestGenerateUpdateFunction(unittest.TestCase):
     """Test generate_update_function."""
@@ -110,6 +119,43 @@ class TestGenerateUpdateFunction(unittest.TestCase):
         # Should have 3 chord labels: C at 0, G at 8, C at 16
         self.assertEqual(block_text.count("LabelPad"), 3)
 
+    def test_matches_model_based_block(self):
+        """Test that the raw-bars path matches generate_update_block on a Song."""
+        from src.models import Song, Bar
+        from src.generator import generate_update_block
+
+        bars = [['C', 'G', 'Am'], ['F'], ['Dm7', 'G7', 'C', 'A7', 'Dm']]
+        song = Song(title="Test", bars=[Bar(chords=chords) for chords in bars])
+
+        block_text, _ = csg.generate_update_function(2, bars)
+        expected, _ = generate_update_block(song, 2)
+
+        self.assertEqual(block_text, expected)
+
+    def test_chords_are_stripped(self):
+        """Test that surrounding whitespace is stripped, as Bar does."""
+        block_text, _ = csg.generate_update_function(0, [[' C ', 'G']])
+
+        self.assertIn("{C}", block_text)
+        self.assertNotIn("{ C }", block_text)
+
+    def test_empty_bars_and_chords_raise_error(self):
+        """Test that empty bars and empty or non-string chords are rejected."""
+        for bars in ([], [[]], [['', 'G']], [['  ', 'G']], [[3, 'G']]):
+            with self.assertRaises(ValueError):
+                csg.generate_update_function(0, bars)
+
+    def test_memoized_block_follows_bar_changes(self):
+        """Test that editing the bars list in place is not masked by the cache."""
+        bars = [['C', 'G']]
+        first, _ = csg.generate_update_function(0, bars)
+        bars[0][1] = 'F'
+        second, _ = csg.generate_update_function(0, bars)
+
+        self.assertIn("{G}", first)
+        self.assertIn("{F}", second)
+        self.assertNotIn("{G}", second)
+
 
 class TestGenerateInitializeSongBlock(unittest.TestCase):
     """Test generate_initialize_song_block."""
@@ -139,6 +185,15 @@ class TestGenerateInitializeSongBlock(unittest.TestCase):
         self.assertIn("else", block)
         self.assertIn("LabelPads {Unassigned}", block)
 
+    def test_dict_and_mixed_song_formats(self):
+        """Test that dict songs (and mixed dict/tuple input) match tuple output."""
+        tuples = [("Song One", 4), ("Song Two", 8)]
+        dicts = [{'title': t, 'num_bars': n} for t, n in tuples]
+
+        expected = csg.generate_initialize_song_block(tuples)
+        self.assertEqual(csg.generate_initialize_song_block(dicts), expected)
+        self.assertEqual(csg.generate_initialize_song_block([dicts[0], tuples[1]]), expected)
+
 
 class TestIndexFileOperations(unittest.TestCase):
     """Test index file read/write operations."""
@@ -370,6 +425,115 @@ class TestPurePythonEncoder(unittest.TestCase):
                        if 'NSMutableDictionary' in obj.get('$classes', [])]
         self.assertEqual(len(nsdict_class), 1)
 
+    def test_nsdata_deduplication_opt_in(self):
+        """Test that identical NSData payloads share one object only when asked."""
+        from src.encoders.archiver import PurePythonArchiver
+
+        data_dict = {'var0': b'\x00' * 16, 'var1': b'\x00' * 16, 'code': b'x'}
+
+        def nsdata_count(archiver):
+            objects = archiver.archive(data_dict)['$objects']
+            return sum(1 for obj in objects if isinstance(obj, dict) and 'NS.data' in obj)
+
+        self.assertEqual(nsdata_count(PurePythonArchiver()), 3)
+        self.assertEqual(nsdata_count(PurePythonArchiver(deduplicate_data=True)), 2)
+
+    def test_number_deduplication_keeps_types_apart(self):
+        """Test that equal numbers of different types get separate objects."""
+        from src.encoders.archiver import PurePythonArchiver
+
+        archiver = PurePythonArchiver()
+        uids = [archiver.add_number(n) for n in (1, 1.0, True, 1.0, 1)]
+
+        self.assertEqual(uids[1], uids[3])
+        self.assertEqual(uids[0], uids[4])
+        self.assertEqual(len({uid.data for uid in uids}), 3)
+
+    def test_float_deduplication_is_exact(self):
+        """Test that floats deduplicate by exact value (-0.0, NaN)."""
+        from src.encoders.archiver import PurePythonArchiver
+
+        archiver = PurePythonArchiver()
+        zero, negative_zero = archiver.add_number(0.0), archiver.add_number(-0.0)
+        nans = [archiver.add_number(float('nan')) for _ in range(2)]
+
+        self.assertNotEqual(zero, negative_zero)
+        self.assertEqual(archiver.add_number(0.0), zero)
+        self.assertEqual(nans[0], nans[1])
+
+    def test_template_matches_full_encode(self):
+        """Test that spliced CODE gives the same bytes as a full encode."""
+        import plistlib
+        from src.encoders.archiver import MozaicEncoder, MozaicTemplate
+
+        encoder = MozaicEncoder()
+        template = MozaicTemplate("song")
+
+        # Includes an empty script (deduplicates against 'data') and sizes
+        # on both sides of the 2-byte offset table boundary
+        for script in ('', '@OnLoad\n  Log {é}\n@End', 'x' * 14, 'x' * 65000, 'x' * 70000):
+            expected = plistlib.dumps(encoder.archive(script, "song"), fmt=plistlib.FMT_BINARY)
+            self.assertEqual(template.encode(script.encode('utf-8')), expected)
+
+    def test_encoder_archive_matches_generic_archiver(self):
+        """Test that the precomputed Mozaic layout matches a full archive."""
+        from src.encoders.archiver import MozaicEncoder, PurePythonArchiver
+
+        encoder = MozaicEncoder()
+        # Includes filenames that collide with strings already in the layout
+        for filename in ['chordSequence', 'Knob 3', 'CODE', '']:
+            expected = PurePythonArchiver().archive(
+                encoder.create_data_dict('@OnLoad\n@End\n', filename)
+            )
+            actual = encoder.archive('@OnLoad\n@End\n', filename)
+            self.assertEqual(actual, expected, f"Layout differs for {filename!r}")
+
+    def test_cext_converts_uids_for_libplist(self):
+        """Test that use_cext hands libplist its own UID type, or falls back."""
+        import plistlib
+        from types import SimpleNamespace
+        from unittest import mock
+        from src.encoders import archiver, bplist
+
+        class StubUID:
+            def __init__(self, data):
+                self.data = data
+
+        received = []
+
+        def stub_dumps(value, fmt):
+            received.append(value)
+            return b'stub'
+
+        def walk(value):
+            yield value
+            children = value.values() if isinstance(value, dict) else (
+                value if isinstance(value, list) else ())
+            for child in children:
+                yield from walk(child)
+
+        stub = SimpleNamespace(dumps=stub_dumps, FMT_BINARY='binary', UID=StubUID)
+        encoder = archiver.MozaicEncoder()
+        archive = encoder.archive('@OnLoad\n@End\n', 'song')
+        with mock.patch.object(bplist, '_libplist', stub), \
+                mock.patch.object(bplist, '_LIBPLIST_UID', StubUID), \
+                mock.patch.object(bplist, 'LIBPLIST_AVAILABLE', True), \
+                mock.patch.object(archiver, 'LIBPLIST_AVAILABLE', True):
+            self.assertEqual(archiver.MozaicEncoder(use_cext=True).encode_stream(
+                '@OnLoad\n@End\n', 'song'), b'stub')
+
+            nodes = list(walk(received[0]))
+            self.assertFalse(any(isinstance(n, plistlib.UID) for n in nodes))
+            self.assertEqual(
+                [n.data for n in nodes if isinstance(n, StubUID)],
+                [n.data for n in walk(archive) if isinstance(n, plistlib.UID)],
+            )
+
+            # A binding that rejects the graph falls back to the Python writer
+            stub.dumps = mock.Mock(side_effect=TypeError("unsupported type"))
+            self.assertEqual(bplist.dumps_binary_cext(archive),
+                             bplist.dumps_binary(archive))
+
 
 class TestGeneratePlistPure(unittest.TestCase):
     """Test generate_plist_pure function."""
@@ -399,6 +563,32 @@ class TestGeneratePlistPure(unittest.TestCase):
 
         self.assertIn(filename.encode('utf-8'), result)
 
+    def test_matches_plistlib_output(self):
+        """Test that the direct writer is byte-identical to plistlib."""
+        import plistlib
+
+        script_text = "@OnLoad\n  Log {Tëst}\n@End"
+        encoder = csg.MozaicEncoder(use_foundation=False)
+        plist = csg.create_nskeyedarchiver_plist_pure(
+            encoder.create_data_dict(script_text, "test")
+        )
+
+        self.assertEqual(
+            csg.generate_plist_pure(script_text, "test"),
+            plistlib.dumps(plist, fmt=plistlib.FMT_BINARY)
+        )
+
+    def test_plistlib_fallback_matches_default(self):
+        """Test that encode() gives the same bytes with the plistlib fallback."""
+        script_text = "@OnLoad\n  Log {Test}\n@End"
+        direct = csg.MozaicEncoder(use_foundation=False)
+        fallback = csg.MozaicEncoder(use_foundation=False, use_plistlib=True)
+
+        self.assertEqual(
+            direct.encode(script_text, "test"),
+            fallback.encode(script_text, "test")
+        )
+
 
 class TestGenerateFullScript(unittest.TestCase):
     """Test generate_full_script function."""
@@ -454,6 +644,31 @@ class TestGenerateFullScript(unittest.TestCase):
         self.assertIn('@UpdateChordsSong1', script)
         self.assertIn('NewTempo = 140', script)
 
+    def test_repeated_calls_reuse_template(self):
+        """Test that repeated generation reuses the cached template."""
+        from src.templates import get_default_manager
+
+        songs_data = [{'title': 'Song', 'tempo': None, 'num_bars': 1,
+                       'update_block': '@UpdateChordsSong0\n@End'}]
+
+        first = csg.generate_full_script(songs_data)
+        second = csg.generate_full_script(songs_data)
+
+        self.assertEqual(first, second)
+        self.assertIs(get_default_manager(), get_default_manager())
+
+    def test_streamed_script_matches_string(self):
+        """Test that streaming to a file object matches generate_full_script."""
+        import io
+
+        songs_data = [{'title': 'Song', 'tempo': 90, 'num_bars': 2,
+                       'update_block': '@UpdateChordsSong0\n@End'}]
+
+        buf = io.StringIO()
+        csg.generate_full_script_to(buf, songs_data)
+
+        self.assertEqual(buf.getvalue(), csg.generate_full_script(songs_data))
+
 
 class TestFillTriggers(unittest.TestCase):
     """Test fill trigger parsing and generation."""
@@ -606,6 +821,24 @@ class TestPydanticModels(unittest.TestCase):
         self.assertEqual(song.bars[0].chords, ['C', 'G', 'Am', 'F'])
         self.assertEqual(song.bars[0].fills, [False, True, False, False])
 
+    def test_song_from_file_cached_follows_edits(self):
+        """Test Song.from_file_cached() reuses parses until the file changes."""
+        from src.models import Song
+
+        song_file = Path(self.test_dir) / "cached.txt"
+        song_file.write_text("Cached Song\nC G\n")
+
+        first = Song.from_file_cached(song_file)
+        self.assertIs(Song.from_file_cached(song_file), first)
+
+        song_file.write_text("Edited Song\nC G Am F\n")
+        st = song_file.stat()
+        os.utime(song_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        edited = Song.from_file_cached(song_file)
+        self.assertEqual(edited.title, "Edited Song")
+        self.assertEqual(edited.bars[0].chords, ['C', 'G', 'Am', 'F'])
+
     def test_song_num_bars_property(self):
         """Test Song.num_bars computed property."""
         from src.models import Song, Bar
@@ -644,6 +877,19 @@ class TestPydanticModels(unittest.TestCase):
 
         self.assertEqual(len(songs), 2)
 
+    def test_song_collection_total_bars(self):
+        """Test SongCollection.total_bars follows added songs."""
+        from src.models import Song, Bar, SongCollection
+
+        songs = SongCollection(songs=[
+            Song(title="Song 1", bars=[Bar(chords=['C']), Bar(chords=['G'])]),
+            Song(title="Song 2", bars=[Bar(chords=['Am'])])
+        ])
+        self.assertEqual(songs.total_bars, 3)
+
+        songs.add_song(Song(title="Song 3", bars=[Bar(chords=['F'])]))
+        self.assertEqual(songs.total_bars, 4)
+
     def test_song_validates_tempo_range(self):
         """Test Song model validates tempo range."""
         from src.models import Song, Bar
@@ -944,6 +1190,42 @@ class TestGenerateTextScript(unittest.TestCase):
         self.assertIn("@OnLoad", script)
         self.assertIn("@End", script)
 
+    def test_generate_script_to_streams_same_text(self):
+        """Test that generate_script_to writes the same script and counts its lines."""
+        import io
+        from src.generator import ChordSequenceGenerator
+        from src.models import Song, Bar, SongCollection
+
+        songs = SongCollection(songs=[
+            Song(title="Test", tempo=100, bars=[Bar(chords=['C', 'G']), Bar(chords=['F'])])
+        ])
+
+        generator = ChordSequenceGenerator()
+        buffer = io.StringIO()
+        num_lines = generator.generate_script_to(songs, buffer)
+
+        script = generator.generate_script(songs)
+        self.assertEqual(buffer.getvalue(), script)
+        self.assertEqual(num_lines, len(script.splitlines()))
+
+    def test_generate_script_cache_follows_song_changes(self):
+        """Test that repeated generate_script calls reuse or re-render correctly."""
+        from src.generator import ChordSequenceGenerator
+        from src.models import Song, Bar, SongCollection
+
+        songs = SongCollection(songs=[
+            Song(title="Test", tempo=100, bars=[Bar(chords=['C', 'G'])])
+        ])
+
+        generator = ChordSequenceGenerator()
+        script = generator.generate_script(songs)
+        self.assertIs(generator.generate_script(songs), script)
+
+        songs.songs[0].title = "Renamed"
+        renamed = generator.generate_script(songs)
+        self.assertIn("Renamed", renamed)
+        self.assertEqual(renamed, ChordSequenceGenerator().generate_script(songs))
+
     def test_generate_script_includes_all_sections(self):
         """Test that generated script includes all required sections."""
         from src.generator import ChordSequenceGenerator
@@ -1045,6 +1327,37 @@ class TestIntegration(unittest.TestCase):
         self.assertIn(b'Test Song 1', plist_bytes)
         self.assertIn(b'Test Song 2', plist_bytes)
 
+    def test_batch_generation_matches_single_files(self):
+        """Test that generate_mozaic_files_batch writes what generate_mozaic_file does."""
+        from src.encoders import MozaicEncoder
+        from src.generator import ChordSequenceGenerator
+        from src.models import Song, Bar, SongCollection
+
+        collections = [
+            SongCollection(songs=[Song(title=f"Song {i}", bars=[Bar(chords=['C', 'G7'])])])
+            for i in range(3)
+        ]
+        # The default encoder, and one whose settings change the bytes
+        custom = ChordSequenceGenerator()
+        custom.encoder = MozaicEncoder(deduplicate_strings=False, deduplicate_data=True)
+
+        for name, generator in (("default", ChordSequenceGenerator()), ("custom", custom)):
+            out_dir = Path(self.test_dir) / name
+            (out_dir / "single").mkdir(parents=True)
+
+            jobs = [(songs, out_dir / f"batch{i}.mozaic")
+                    for i, songs in enumerate(collections)]
+            generator.generate_mozaic_files_batch(jobs, max_workers=2)
+
+            for songs, output_path in jobs:
+                expected_path = out_dir / "single" / output_path.name
+                generator.generate_mozaic_file(songs, expected_path)
+                self.assertEqual(output_path.read_bytes(), expected_path.read_bytes())
+
+        # The custom encoder really produces different files
+        self.assertNotEqual((Path(self.test_dir) / "default" / "batch0.mozaic").read_bytes(),
+                            (Path(self.test_dir) / "custom" / "batch0.mozaic").read_bytes())
+
 
 class TestChordNotePlayback(unittest.TestCase):
     """Test chord MIDI note playback functionality."""
@@ -1262,6 +1575,22 @@ class TestSimplifiedVoicings(unittest.TestCase):
         d_major = chord_to_midi_notes("D", octave=3)
         self.assertEqual(d6_simplified, d_major)
 
+    def test_chord_midi_tuple_matches_list_functions(self):
+        """Test chord_midi_tuple backs both the full and simplified variants."""
+        from src.chord_notes import (
+            chord_midi_tuple, chord_to_midi_notes, chord_to_simplified_midi_notes
+        )
+
+        self.assertEqual(chord_midi_tuple("C6"), tuple(chord_to_midi_notes("C6")))
+        self.assertEqual(chord_midi_tuple("C6", simplified=True),
+                         tuple(chord_to_simplified_midi_notes("C6")))
+        self.assertEqual(chord_midi_tuple("C6", simplified=True), (48, 52, 55))
+
+        # The list functions hand out copies of the cached tuple
+        notes = chord_to_midi_notes("G7")
+        notes.append(0)
+        self.assertEqual(chord_to_midi_notes("G7"), list(chord_midi_tuple("G7")))
+
     def test_bar_model_populates_simplified_chord_notes(self):
         """Test that Bar model auto-populates simplified_chord_notes."""
         from src.models import Bar